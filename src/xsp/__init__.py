@@ -8,6 +8,7 @@ from xsp.core.exceptions import (
     TransportError,
     UpstreamError,
     UpstreamTimeout,
+    UpstreamTimeoutError,
     ValidationError,
     XspError,
 )
@@ -27,6 +28,7 @@ __all__ = [
     "Upstream",
     "UpstreamError",
     "UpstreamTimeout",
+    "UpstreamTimeoutError",
     "ValidationError",
     "XspError",
 ]
@@ -46,6 +46,18 @@ def main() -> None:
 
     args = parser.parse_args()
 
+    # With --no-validate the full string is never needed; stream it out
+    if args.format == "toml" and not args.validate:
+        if args.output:
+            with args.output.open("w") as stream:
+                ConfigGenerator.generate_toml_to(stream, group_by=args.group_by)
+            print(f"Configuration template written to {args.output}", file=sys.stderr)
+        else:
+            ConfigGenerator.generate_toml_to(sys.stdout, group_by=args.group_by)
+            # Match the trailing newline print() adds on the validated path
+            sys.stdout.write("\n")
+        return
+
     # Generate template
     if args.format == "toml":
         template = ConfigGenerator.generate_toml(group_by=args.group_by, validate=args.validate)
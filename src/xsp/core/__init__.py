@@ -1,6 +1,14 @@
 """Core abstractions."""
 
 from xsp.core.base import BaseUpstream
+
+# The @configurable decorator itself is not re-exported: binding it here
+# would shadow the xsp.core.configurable submodule attribute.
+from xsp.core.configurable import (
+    ConfigMetadata,
+    ParameterInfo,
+    get_configurable_registry,
+)
 from xsp.core.dialer import Dialer, HttpDialer
 from xsp.core.exceptions import (
     BudgetExceeded,
@@ -9,6 +17,7 @@ from xsp.core.exceptions import (
     TransportError,
     UpstreamError,
     UpstreamTimeout,
+    UpstreamTimeoutError,
     ValidationError,
     XspError,
 )
@@ -22,6 +31,7 @@ from xsp.core.upstream import Upstream
 __all__ = [
     "BaseUpstream",
     "BudgetExceeded",
+    "ConfigMetadata",
     "Context",
     "DecodeError",
     "Dialer",
@@ -29,6 +39,7 @@ __all__ = [
     "Headers",
     "InMemoryStateBackend",
     "Metadata",
+    "ParameterInfo",
     "Params",
     "ProtocolHandler",
     "RedisStateBackend",
@@ -42,7 +53,9 @@ __all__ = [
     "UpstreamError",
     "UpstreamSession",
     "UpstreamTimeout",
+    "UpstreamTimeoutError",
     "ValidationError",
     "VastSession",
     "XspError",
+    "get_configurable_registry",
 ]
@@ -1,6 +1,7 @@
 """Base upstream implementation."""
 
 import asyncio
+import json
 from collections.abc import Callable
 from typing import Any, Generic, TypeVar
 
@@ -67,8 +68,9 @@ class BaseUpstream(Generic[T]):
                 timeout=default_timeout,
             )
             self.endpoint = endpoint
-            self.default_params = default_params or {}
-            self.default_headers = default_headers or {}
+            # Share the config's dicts rather than allocating a second pair
+            self.default_params = self.config.params
+            self.default_headers = self.config.headers
             self.default_timeout = default_timeout
 
     async def request(
@@ -102,9 +104,9 @@ class BaseUpstream(Generic[T]):
             TransportError: If transport operation fails
             DecodeError: If response decoding fails
         """
-        # Merge parameters
-        merged_params = {**self.default_params, **(params or {})}
-        merged_headers = {**self.default_headers, **(headers or {})}
+        # Merge parameters; without per-call params the defaults are only
+        # read, so reuse them instead of allocating an empty dict and a copy
+        merged_params = {**self.default_params, **params} if params else self.default_params
         effective_timeout = timeout if timeout is not None else self.default_timeout
         effective_endpoint = endpoint or self.endpoint
 
@@ -115,13 +117,12 @@ class BaseUpstream(Generic[T]):
                 raise ValueError("Encoder not provided but payload specified")
             encoded_payload = self.encoder(payload)
 
-        # Prepare metadata (headers)
-        metadata = merged_headers.copy()
+        # Prepare metadata (headers): one fresh dict, since "_params" is
+        # added to it below
+        metadata = {**self.default_headers, **headers} if headers else self.default_headers.copy()
 
         # Add params to metadata if supported
         if merged_params:
-            import json
-
             metadata["_params"] = json.dumps(merged_params)
 
         # Send request with timeout
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import os
+import threading
 from dataclasses import dataclass, field, replace
 from typing import Any, Literal
 
+from dotenv import dotenv_values
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-@dataclass
+@dataclass(slots=True)
 class UpstreamConfig:
     """
     Transport-agnostic upstream configuration.
@@ -155,18 +158,58 @@ class XspSettings(BaseSettings):
 # Lazy global settings accessor for xsp-lib.
 # Use get_settings() to access configuration. For tests, use set_settings() to override.
 _settings_instance: XspSettings | None = None
+_settings_lock = threading.Lock()
+# Prefix-filtered, lowercased .env contents, read once per process
+_dotenv_cache: dict[str, str] | None = None
+
+
+def _load_settings() -> XspSettings:
+    """
+    Builds XspSettings, parsing the .env file only on the first call.
+    Later calls (e.g. after set_settings(None)) reuse the cached values and
+    pass _env_file=None so pydantic-settings skips the file entirely.
+    Process environment variables still take precedence over .env values.
+    """
+    global _dotenv_cache
+    config = XspSettings.model_config
+    prefix = config.get("env_prefix", "").lower()
+    if _dotenv_cache is None:
+        env_file = config.get("env_file")
+        values = (
+            dotenv_values(env_file, encoding=config.get("env_file_encoding"))
+            if isinstance(env_file, str)
+            else {}
+        )
+        _dotenv_cache = {
+            key.lower(): value
+            for key, value in values.items()
+            if value is not None and key.lower().startswith(prefix)
+        }
+    environ = {key.lower() for key in os.environ}
+    # Typed as Any: values are raw strings that pydantic coerces per field
+    overrides: dict[str, Any] = {
+        key[len(prefix) :]: value for key, value in _dotenv_cache.items() if key not in environ
+    }
+    return XspSettings(_env_file=None, **overrides)  # type: ignore[call-arg]
+
 
 def get_settings() -> XspSettings:
     """
     Returns the global XspSettings instance, lazily initialized.
+    Thread-safe: concurrent first calls construct XspSettings only once.
     For test isolation, use set_settings() to override.
     Returns:
         XspSettings: The current settings instance.
     """
     global _settings_instance
-    if _settings_instance is None:
-        _settings_instance = XspSettings()
-    return _settings_instance
+    instance = _settings_instance
+    if instance is not None:
+        return instance
+    with _settings_lock:
+        if _settings_instance is None:
+            _settings_instance = _load_settings()
+        return _settings_instance
+
 
 def set_settings(settings: XspSettings | None) -> None:
     """
@@ -175,4 +218,27 @@ def set_settings(settings: XspSettings | None) -> None:
         settings (XspSettings | None): The new settings instance, or None to reset.
     """
     global _settings_instance
-    _settings_instance = settings
+    with _settings_lock:
+        _settings_instance = settings
+
+
+def set_settings_overrides(**overrides: Any) -> XspSettings:
+    """
+    Replaces the global settings with a copy of the current ones plus overrides.
+    Uses model_copy(update=...), which skips pydantic validation and the
+    env/.env/secrets reads, so it is cheap enough for per-test overrides.
+    Overrides are not validated; for a full replacement without validation
+    use set_settings(XspSettings.model_construct(...)).
+    Args:
+        **overrides: Field values to replace, e.g. vast_timeout=5.0.
+    Returns:
+        XspSettings: The new settings instance.
+    """
+    global _settings_instance
+    # Read, copy and store under one lock so concurrent overrides compose
+    with _settings_lock:
+        base = _settings_instance
+        if base is None:
+            base = _load_settings()
+        _settings_instance = base.model_copy(update=overrides)
+        return _settings_instance
@@ -1,25 +1,60 @@
 """Generate configuration templates from @configurable registry."""
 
-import enum
+import io
 import tomllib
-from collections import defaultdict
-
-import tomlkit
-
-from .configurable import ConfigMetadata, get_configurable_registry
+from collections.abc import Iterable, Mapping
+from typing import Any, TextIO
+
+from .configurable import (
+    ConfigMetadata,
+    _format_toml_key,
+    _format_type,
+    _registry_version,
+    _sorted_namespaces,
+    get_configurable_registry,
+)
+
+_TEMPLATE_HEADER = (
+    "# XSP-lib Configuration Template\n"
+    "# Auto-generated from @configurable registry\n"
+    "#\n"
+    "# This file contains all configurable parameters from xsp-lib.\n"
+    "# Uncomment and modify values as needed.\n"
+    "\n"
+)
+
+# Resolved once at import; requires-python >= 3.11 guarantees stdlib tomllib
+_toml_loads = tomllib.loads
 
 
 class ConfigGenerator:
     """Generate configuration files from @configurable registry."""
 
+    # Rendered templates keyed by (group_by, include_defaults); only valid
+    # for the registry version in _toml_cache_version
+    _toml_cache: dict[tuple[str, bool], str] = {}
+    _toml_cache_version: int = -1
+    # Cache keys whose text already passed validation at this version
+    _toml_validated: set[tuple[str, bool]] = set()
+
     @staticmethod
-    def generate_toml(group_by: str = "namespace", validate: bool = True) -> str:
+    def generate_toml(
+        group_by: str = "namespace",
+        validate: bool = True,
+        include_defaults: bool = True,
+    ) -> str:
         """
         Generate TOML configuration template.
 
+        The rendered text is memoized until the next @configurable
+        registration, so repeated calls return the cached string. Validation
+        re-parses it with tomllib once per memoized string, not per call.
+
         Args:
             group_by: Grouping strategy ("namespace" or "class")
-            validate: Validate generated TOML (default: True)
+            validate: Re-parse generated TOML to check it (default: True)
+            include_defaults: Emit default values as live assignments; when
+                False they are written as commented-out placeholders
 
         Returns:
             TOML configuration string
@@ -27,66 +62,102 @@ class ConfigGenerator:
         Raises:
             ValueError: If group_by is invalid or generated TOML is invalid
         """
-        registry = get_configurable_registry()
+        version = _registry_version()
+        cache = ConfigGenerator._toml_cache
+        validated = ConfigGenerator._toml_validated
+        if ConfigGenerator._toml_cache_version != version:
+            cache.clear()
+            validated.clear()
+            ConfigGenerator._toml_cache_version = version
+
+        key = (group_by, include_defaults)
+        toml_str = cache.get(key)
+        if toml_str is None:
+            buf = io.StringIO()
+            ConfigGenerator.generate_toml_to(
+                buf, group_by=group_by, include_defaults=include_defaults
+            )
+            toml_str = cache[key] = buf.getvalue()
 
-        if group_by == "namespace":
-            grouped = ConfigGenerator._group_by_namespace(registry)
-        elif group_by == "class":
-            grouped = ConfigGenerator._group_by_class(registry)
-        else:
-            raise ValueError(f"Unknown group_by: {group_by}")
+        # Validate if requested
+        if validate and key not in validated:
+            ConfigGenerator._validate_toml(toml_str)
+            validated.add(key)
 
-        # Create TOML document using tomlkit
-        doc = tomlkit.document()
-        doc.add(tomlkit.comment("XSP-lib Configuration Template"))
-        doc.add(tomlkit.comment("Auto-generated from @configurable registry"))
-        doc.add(tomlkit.comment(""))
-        doc.add(tomlkit.comment("This file contains all configurable parameters from xsp-lib."))
-        doc.add(tomlkit.comment("Uncomment and modify values as needed."))
-        doc.add(tomlkit.nl())
+        return toml_str
 
-        for section, metadata_list in sorted(grouped.items()):
-            # Create section table
-            section_table = tomlkit.table()
+    @staticmethod
+    def generate_toml_to(
+        stream: TextIO,
+        group_by: str = "namespace",
+        include_defaults: bool = True,
+    ) -> None:
+        """
+        Write TOML configuration template to a text stream.
 
-            for metadata in metadata_list:
-                if metadata.description:
-                    section_table.add(tomlkit.comment(metadata.description))
+        Streams the template section by section instead of building the whole
+        string first, so writing to a file keeps memory flat regardless of
+        registry size. No validation is performed; use generate_toml() with
+        validate=True when the text needs checking.
 
-                section_table.add(tomlkit.comment(f"Source: {metadata.cls.__name__}"))
-                section_table.add(tomlkit.nl())
+        Args:
+            stream: Writable text stream (open file, StringIO, sys.stdout)
+            group_by: Grouping strategy ("namespace" or "class")
+            include_defaults: Emit default values as live assignments; when
+                False they are written as commented-out placeholders
 
-                for param_name, param_info in metadata.parameters.items():
-                    # Add parameter description
-                    if param_info.description:
-                        section_table.add(tomlkit.comment(param_info.description))
+        Raises:
+            ValueError: If group_by is invalid
+        """
+        grouped = ConfigGenerator._group(group_by)
 
-                    # Add type hint as comment
-                    type_str = ConfigGenerator._format_type(param_info.type)
-                    section_table.add(tomlkit.comment(f"Type: {type_str}"))
+        # Write TOML directly; the template is write-only, so there is no
+        # need for a comment-preserving document model (tomlkit) or a
+        # dict serializer (tomli_w) that can't carry the comments.
+        # Bind the bound method once for the per-class loop
+        write = stream.write
+        write(_TEMPLATE_HEADER)
 
-                    # Add parameter with default value
-                    # Convert enum values to their string representation
-                    value = param_info.default
-                    if isinstance(value, enum.Enum):
-                        value = value.value
-                    # Handle None values - represent as empty string in TOML
-                    elif value is None:
-                        value = ""
+        for section, metadata_list in grouped.items():
+            write(f"[{_format_toml_key(section)}]\n")
 
-                    section_table[param_name] = value
-                    section_table.add(tomlkit.nl())
+            for metadata in metadata_list:
+                # Comments and assignments were rendered once at decoration.
+                # Commented-out defaults keep the template as documentation
+                # while leaving the parsed config empty.
+                write(metadata.body if include_defaults else metadata.commented_body)
 
-            doc[section] = section_table
-            doc.add(tomlkit.nl())
+            write("\n")
 
-        toml_str = tomlkit.dumps(doc)
+    @staticmethod
+    def generate_dict(group_by: str = "namespace") -> dict[str, dict[str, Any]]:
+        """
+        Build the configuration template as nested plain data.
 
-        # Validate if requested
-        if validate:
-            ConfigGenerator._validate_toml(toml_str)
+        Returns the same structure tomllib would parse out of generate_toml()
+        (tuples as lists, unknown types as their str() form), built straight
+        from the registry, so programmatic consumers and tests skip the TOML
+        render/parse round trip.
 
-        return toml_str
+        Args:
+            group_by: Grouping strategy ("namespace" or "class")
+
+        Returns:
+            Mapping of section name to {parameter name: default value}
+
+        Raises:
+            ValueError: If group_by is invalid
+        """
+        grouped = ConfigGenerator._group(group_by)
+        result: dict[str, dict[str, Any]] = {}
+
+        for section, metadata_list in grouped.items():
+            values = result.setdefault(section, {})
+            for metadata in metadata_list:
+                for param_name, param_info in metadata.parameters.items():
+                    values[param_name] = param_info.toml_default
+
+        return result
 
     @staticmethod
     def generate_yaml(group_by: str = "namespace") -> str:
@@ -95,36 +166,60 @@ class ConfigGenerator:
         raise NotImplementedError("YAML generation coming in future PR")
 
     @staticmethod
-    def _group_by_namespace(registry: dict[str, ConfigMetadata]) -> dict[str, list[ConfigMetadata]]:
-        """Group metadata by namespace."""
-        grouped: dict[str, list[ConfigMetadata]] = defaultdict(list)
+    def _group(group_by: str) -> dict[str, list[ConfigMetadata]]:
+        """Group the current registry by the given strategy, in section order."""
+        registry = get_configurable_registry()
 
-        for metadata in registry.values():
-            grouped[metadata.namespace].append(metadata)
+        if group_by == "namespace":
+            return ConfigGenerator._group_by_namespace(registry)
+        if group_by == "class":
+            return dict(sorted(ConfigGenerator._group_by_class(registry).items()))
+        raise ValueError(f"Unknown group_by: {group_by}")
+
+    @staticmethod
+    def _group_by_namespace(
+        registry: Mapping[str, ConfigMetadata],
+    ) -> dict[str, list[ConfigMetadata]]:
+        """Group metadata by namespace, in sorted namespace order."""
+        grouped: dict[str, list[ConfigMetadata]] = {}
+
+        # Registry keys are namespaces. The live view is already kept sorted
+        # at registration; any other mapping (e.g. a snapshot) is sorted here.
+        if registry is get_configurable_registry():
+            namespaces: Iterable[str] = _sorted_namespaces()
+        else:
+            namespaces = sorted(registry)
+
+        for namespace in namespaces:
+            metadata = registry[namespace]
+            key = metadata.namespace
+            bucket = grouped.get(key)
+            if bucket is None:
+                grouped[key] = [metadata]
+            else:
+                bucket.append(metadata)
 
         return grouped
 
     @staticmethod
-    def _group_by_class(registry: dict[str, ConfigMetadata]) -> dict[str, list[ConfigMetadata]]:
+    def _group_by_class(registry: Mapping[str, ConfigMetadata]) -> dict[str, list[ConfigMetadata]]:
         """Group metadata by class name (lowercased)."""
-        grouped: dict[str, list[ConfigMetadata]] = defaultdict(list)
+        grouped: dict[str, list[ConfigMetadata]] = {}
 
         for metadata in registry.values():
-            key = metadata.cls.__name__.lower()
-            grouped[key].append(metadata)
+            key = metadata.class_key
+            bucket = grouped.get(key)
+            if bucket is None:
+                grouped[key] = [metadata]
+            else:
+                bucket.append(metadata)
 
         return grouped
 
     @staticmethod
     def _format_type(type_hint: type | str) -> str:
         """Format type hint for display."""
-        if isinstance(type_hint, str):
-            return type_hint
-
-        if hasattr(type_hint, "__name__"):
-            return type_hint.__name__
-
-        return str(type_hint)
+        return _format_type(type_hint)
 
     @staticmethod
     def _validate_toml(toml_str: str) -> None:
@@ -138,6 +233,6 @@ class ConfigGenerator:
             ValueError: If TOML is invalid
         """
         try:
-            tomllib.loads(toml_str)
+            _toml_loads(toml_str)
         except Exception as e:
             raise ValueError(f"Generated TOML is invalid: {e}\n\n{toml_str}") from e
@@ -74,9 +74,18 @@ This ensures clear separation between required (positional) and optional
 (configurable) parameters.
 """
 
+import bisect
+import enum
+import functools
 import inspect
+import re
+import sys
+import types
+import warnings
+import weakref
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Any, Callable, TypeVar, get_type_hints
+from typing import Any, Callable, TextIO, TypeVar, get_type_hints
 
 # Type variable for generic decorator
 T = TypeVar("T")
@@ -84,8 +93,29 @@ T = TypeVar("T")
 # Global registry of all configurable classes
 _CONFIGURABLE_REGISTRY: dict[str, "ConfigMetadata"] = {}
 
+# Read-only live view handed out by get_configurable_registry()
+_REGISTRY_VIEW: Mapping[str, "ConfigMetadata"] = types.MappingProxyType(_CONFIGURABLE_REGISTRY)
 
-@dataclass(frozen=True)
+# Bumped on every registry mutation; keys caches derived from the registry
+_REGISTRY_VERSION = 0
+
+# (registry version, rendered text) from the last generate_toml_template()
+_TEMPLATE_CACHE: tuple[int, str] | None = None
+
+# Every class registered per namespace, maintained by the decorator
+_BY_NAMESPACE: dict[str, tuple["ConfigMetadata", ...]] = {}
+
+# Registry keys kept in sorted order at registration (bisect.insort), so
+# generators can emit sections in order without sorting on every call
+_SORTED_NAMESPACES: list[str] = []
+
+# Extracted parameters per class, held weakly; see _extract_parameters()
+_PARAM_CACHE: "weakref.WeakKeyDictionary[type, dict[str, ParameterInfo]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@dataclass(frozen=True, slots=True)
 class ParameterInfo:
     """Information about a single configurable parameter.
     
@@ -94,6 +124,9 @@ class ParameterInfo:
         type: Type annotation as string (e.g., "VastVersion", "float")
         default: Default value for parameter
         description: Optional description from docstring
+        toml_default: Default as parsed back from the TOML output (derived)
+        toml_value: toml_default rendered as TOML (derived)
+        comment: Rendered TOML comment lines for the parameter (derived)
         
     Example:
         >>> param = ParameterInfo(
@@ -112,9 +145,29 @@ class ParameterInfo:
     type: str
     default: Any
     description: str | None = None
+    # Default as TOML parses it back (enum -> value, None -> ""), derived once
+    toml_default: Any = field(init=False, repr=False, compare=False)
+    # toml_default rendered as a TOML value string
+    toml_value: str = field(init=False, repr=False, compare=False)
+    # Rendered "# description" / "# Type: ..." lines, emitted in one write
+    comment: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        default = self.default
+        if isinstance(default, enum.Enum):
+            default = default.value
+        elif default is None:
+            default = ""
+        object.__setattr__(self, "toml_default", _value_to_data(default))
+        object.__setattr__(self, "toml_value", _value_to_toml(default))
 
+        comment = "# Type: " + self.type + "\n"
+        if self.description:
+            comment = _format_toml_comment(self.description) + comment
+        object.__setattr__(self, "comment", comment)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ConfigMetadata:
     """Metadata about a configurable class.
     
@@ -126,6 +179,12 @@ class ConfigMetadata:
         namespace: Namespace for TOML section (e.g., "vast", "openrtb")
         description: Human-readable description of the class
         parameters: Dictionary mapping parameter names to ParameterInfo
+        header: Rendered TOML comment block for the class (derived)
+        body: Header plus every parameter as a live assignment (derived)
+        commented_body: Header plus commented-out assignments (derived)
+        sorted_parameters: Parameter items ordered by name (derived)
+        defaults: Parameter name to raw default value, used by bind() (derived)
+        class_key: Lowercased class name for class grouping (derived)
         
     Example:
         >>> metadata = ConfigMetadata(
@@ -147,6 +206,262 @@ class ConfigMetadata:
     namespace: str
     description: str | None
     parameters: dict[str, ParameterInfo] = field(default_factory=dict)
+    # Rendered "# description" / "# Source: Cls" comment block, computed once
+    # so every generate_toml call (and both group_by modes) can reuse it
+    header: str = field(init=False, repr=False, compare=False)
+    # Fully rendered ConfigGenerator section bodies for this class, with
+    # defaults live or commented out; the generator only writes these
+    body: str = field(init=False, repr=False, compare=False)
+    commented_body: str = field(init=False, repr=False, compare=False)
+    # Parameter items sorted by name for generate_toml_template, sorted once
+    # here instead of on every template rebuild
+    sorted_parameters: tuple[tuple[str, ParameterInfo], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    # Parameter defaults as constructor kwargs, merged by bind()
+    defaults: dict[str, Any] = field(init=False, repr=False, compare=False)
+    # Lowercased class name used as the section key for group_by="class"
+    class_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        header = "# Source: " + self.cls.__name__ + "\n\n"
+        if self.description:
+            header = _format_toml_comment(self.description) + header
+        object.__setattr__(self, "header", header)
+
+        assignments = [
+            (info.comment, name + " = " + info.toml_value + "\n\n")
+            for name, info in self.parameters.items()
+        ]
+        object.__setattr__(self, "body", header + "".join(c + a for c, a in assignments))
+        object.__setattr__(
+            self, "commented_body", header + "".join(c + "# " + a for c, a in assignments)
+        )
+        object.__setattr__(self, "sorted_parameters", tuple(sorted(self.parameters.items())))
+        object.__setattr__(
+            self, "defaults", {name: info.default for name, info in self.parameters.items()}
+        )
+        object.__setattr__(self, "class_key", self.cls.__name__.lower())
+
+    def bind(self, **overrides: Any) -> dict[str, Any]:
+        """Merge overrides onto the parameter defaults.
+
+        A plain dict merge over defaults precomputed at decoration, so
+        request-time code can build constructor kwargs without ever calling
+        inspect.signature or Signature.bind_partial.
+
+        Args:
+            **overrides: Parameter values replacing the defaults
+
+        Returns:
+            dict[str, Any]: Keyword arguments for the configurable class
+
+        Raises:
+            TypeError: If an override names an unknown parameter
+
+        Example:
+            >>> kwargs = VastUpstream.__configurable_metadata__.bind(validate_xml=True)
+            >>> kwargs["validate_xml"]
+            True
+        """
+        if not overrides:
+            return dict(self.defaults)
+        unknown = overrides.keys() - self.defaults.keys()
+        if unknown:
+            raise TypeError(
+                f"{self.cls.__name__} has no configurable parameter(s): "
+                + ", ".join(sorted(unknown))
+            )
+        return {**self.defaults, **overrides}
+
+
+_ARGS_HEADER_RE = re.compile(r"^(\s*)Args:\s*$")
+_ARG_LINE_RE = re.compile(r"^(\s+)(\w+)\s*(?:\([^)]*\))?\s*:\s*(.*\S)?\s*$")
+
+
+def _parse_args_section(docstring: str | None) -> dict[str, str]:
+    """Parse the Google-style ``Args:`` section of a docstring.
+
+    Walks the docstring once and maps each argument name to its
+    description, so callers look descriptions up by name instead of
+    re-scanning the docstring per parameter. Works on raw ``__doc__``
+    text: indentation is tracked relative to the ``Args:`` header, so no
+    cleandoc pass is needed. Deeper-indented lines continue the previous
+    entry; the first line dedented to the header level ends the section.
+
+    Args:
+        docstring: Raw or cleaned docstring, or None
+
+    Returns:
+        dict[str, str]: Argument name to description
+
+    Example:
+        >>> _parse_args_section("Init.\\n\\nArgs:\\n    timeout: Seconds")
+        {'timeout': 'Seconds'}
+    """
+    descriptions: dict[str, str] = {}
+    if not docstring:
+        return descriptions
+
+    header_indent = -1
+    entry_indent = -1
+    current = ""
+    parts: list[str] = []
+    for line in docstring.splitlines():
+        if header_indent < 0:
+            header = _ARGS_HEADER_RE.match(line)
+            if header:
+                header_indent = len(header.group(1))
+            continue
+
+        stripped = line.lstrip()
+        if not stripped:
+            continue
+        indent = len(line) - len(stripped)
+
+        # Dedent back to the header level (Returns:, Raises:, ...) ends it
+        if indent <= header_indent:
+            break
+
+        if entry_indent < 0 or indent == entry_indent:
+            match = _ARG_LINE_RE.match(line)
+            if match:
+                # Flush the previous entry; empty descriptions are dropped
+                if parts:
+                    descriptions[current] = " ".join(parts)
+                entry_indent = len(match.group(1))
+                current = match.group(2)
+                parts = [match.group(3)] if match.group(3) else []
+                continue
+
+        # Continuation of the current entry's description
+        if current and indent > entry_indent:
+            parts.append(stripped.rstrip())
+
+    if parts:
+        descriptions[current] = " ".join(parts)
+
+    return descriptions
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_type_hints(func: Callable[..., Any]) -> dict[str, Any]:
+    """Resolve type hints for a function, caching by function object.
+
+    get_type_hints evaluates string annotations and walks module globals,
+    which makes it the slowest step of parameter extraction. Subclasses that
+    inherit __init__ share the same function and hit the cache. Bounded so
+    short-lived classes (e.g. defined in tests) are not pinned forever.
+
+    Args:
+        func: Function whose annotations to resolve (typically __init__)
+
+    Returns:
+        dict[str, Any]: Resolved hints, or an empty dict if resolution fails
+    """
+    # Without string annotations (no `from __future__ import annotations`)
+    # the raw dict already holds the real types; skip resolution entirely
+    raw = getattr(func, "__annotations__", None)
+    if isinstance(raw, dict) and not any(isinstance(v, str) for v in raw.values()):
+        return raw
+
+    try:
+        return get_type_hints(func)
+    except Exception:
+        return {}
+
+
+def _extract_parameters(cls: type) -> dict[str, ParameterInfo]:
+    """Extract configurable parameters from a class's __init__.
+
+    Plain Python __init__ functions are read directly from their code
+    object and __kwdefaults__; inspect.signature is only used for C-level
+    or wrapped initializers. Results are cached per class: type-hint
+    resolution dominates decoration cost, and a class's __init__ does not
+    change after definition. The cache holds classes weakly so locally
+    defined classes (e.g. in tests) can still be collected.
+
+    Args:
+        cls: Class whose keyword-only __init__ parameters to extract
+
+    Returns:
+        dict[str, ParameterInfo]: Parameters with defaults, by name
+
+    Raises:
+        TypeError: If the __init__ signature cannot be inspected
+    """
+    cached = _PARAM_CACHE.get(cls)
+    if cached is not None:
+        return cached
+
+    # Only keyword-only parameters are configurable; if the code object has
+    # none, skip signature and type-hint work. Wrapped __init__s are left to
+    # inspect.signature, which follows __wrapped__ to the real parameters.
+    # Looked up via getattr: mypy rejects reading __init__ off a class object,
+    # and the function attributes read below are not on its declared type
+    init: Any = getattr(cls, "__init__")
+    # Classes that don't override __init__ have nothing to configure
+    if init is object.__init__:
+        return {}
+    code = getattr(init, "__code__", None)
+    if code is not None and code.co_kwonlyargcount == 0 and not hasattr(init, "__wrapped__"):
+        return {}
+
+    if code is not None and not hasattr(init, "__wrapped__"):
+        # Plain Python function: read keyword-only names and defaults
+        # straight off the code object instead of building a Signature
+        start = code.co_argcount
+        kwonly_names = code.co_varnames[start:start + code.co_kwonlyargcount]
+        kwdefaults = init.__kwdefaults__ or {}
+        candidates = [(name, kwdefaults[name]) for name in kwonly_names if name in kwdefaults]
+    else:
+        # C-level or wrapped __init__: fall back to inspect.signature
+        try:
+            sig = inspect.signature(init)
+        except (ValueError, TypeError) as e:
+            raise TypeError(f"Cannot get signature for {cls.__name__}.__init__: {e}")
+        candidates = [
+            (name, param.default)
+            for name, param in sig.parameters.items()
+            if param.kind is inspect.Parameter.KEYWORD_ONLY
+            and param.default is not inspect.Parameter.empty
+        ]
+
+    # Get type hints for __init__; raw annotations cover names whose hints
+    # could not be resolved
+    type_hints = _cached_type_hints(init)
+    raw_annotations = getattr(init, "__annotations__", None) or {}
+
+    # Parameter descriptions from the __init__ docstring, parsed once
+    arg_descriptions = _parse_args_section(init.__doc__)
+
+    # Keyword-only parameters with defaults
+    configurable_params: dict[str, ParameterInfo] = {}
+
+    for param_name, default in candidates:
+        # Interned like the namespace: names key the parameters mapping and
+        # the template override slots, so lookups compare by identity
+        param_name = sys.intern(param_name)
+
+        # Get type annotation
+        type_annotation = type_hints.get(
+            param_name, raw_annotations.get(param_name, inspect.Parameter.empty)
+        )
+        if type_annotation is inspect.Parameter.empty:
+            type_str = "Any"
+        else:
+            type_str = _format_type(type_annotation)
+
+        # Create ParameterInfo
+        configurable_params[param_name] = ParameterInfo(
+            name=param_name,
+            type=type_str,
+            default=default,
+            description=arg_descriptions.get(param_name)
+        )
+
+    _PARAM_CACHE[cls] = configurable_params
+    return configurable_params
 
 
 def configurable(
@@ -160,6 +475,12 @@ def configurable(
     the class in the global configurable registry. Only parameters after
     the `*` in __init__ signature with default values are considered
     configurable.
+
+    Decoration introspects __init__ and is meant to run once, at import
+    time. Never apply it per request (e.g. inside a factory function) and
+    never use inspect on request paths; use ConfigMetadata.bind() to build
+    constructor kwargs from the precomputed defaults instead. Re-decorating
+    a class with the same module and qualified name emits a RuntimeWarning.
     
     Args:
         namespace: Namespace for TOML section. If None, uses class name
@@ -194,62 +515,19 @@ def configurable(
         'vast'
     """
     def decorator(cls: type[T]) -> type[T]:
+        global _REGISTRY_VERSION
+
         # Extract parameters from __init__
-        try:
-            sig = inspect.signature(cls.__init__)
-        except (ValueError, TypeError) as e:
-            raise TypeError(f"Cannot get signature for {cls.__name__}.__init__: {e}")
-        
-        # Get type hints for __init__
-        try:
-            type_hints = get_type_hints(cls.__init__)
-        except Exception:
-            type_hints = {}
-        
-        # Extract keyword-only parameters with defaults
-        configurable_params: dict[str, ParameterInfo] = {}
-        
-        found_kwonly = False
-        for param_name, param in sig.parameters.items():
-            # Skip 'self'
-            if param_name == "self":
-                continue
-            
-            # Only process keyword-only parameters
-            if param.kind != inspect.Parameter.KEYWORD_ONLY:
-                continue
-            
-            found_kwonly = True
-            
-            # Only include if has default value
-            if param.default is inspect.Parameter.empty:
-                continue
-            
-            # Get type annotation
-            type_annotation = type_hints.get(param_name, param.annotation)
-            if type_annotation is inspect.Parameter.empty:
-                type_str = "Any"
-            else:
-                # Convert type to string
-                if hasattr(type_annotation, "__name__"):
-                    type_str = type_annotation.__name__
-                else:
-                    type_str = str(type_annotation)
-            
-            # Create ParameterInfo
-            configurable_params[param_name] = ParameterInfo(
-                name=param_name,
-                type=type_str,
-                default=param.default,
-                description=None  # TODO: Extract from docstring
-            )
+        configurable_params = _extract_parameters(cls)
         
         if not configurable_params:
             # This is just a warning - class is still decorated but has no config
             pass
         
         # Determine namespace
-        ns = namespace if namespace is not None else cls.__name__.lower()
+        # Interned: many classes share a namespace, and the registry, index
+        # and grouping dicts all key on it
+        ns = sys.intern(namespace if namespace is not None else cls.__name__.lower())
         
         # Create metadata
         metadata = ConfigMetadata(
@@ -260,7 +538,31 @@ def configurable(
         )
         
         # Register in global registry
+        previous = _CONFIGURABLE_REGISTRY.get(ns)
+        if previous is None:
+            bisect.insort(_SORTED_NAMESPACES, ns)
+        elif (
+            previous.cls is not cls
+            and previous.cls.__qualname__ == cls.__qualname__
+            and previous.cls.__module__ == cls.__module__
+        ):
+            # Same class definition executed again: the decorator is being
+            # run at request time rather than once at import
+            warnings.warn(
+                f"@configurable re-registered {cls.__module__}.{cls.__qualname__} "
+                f"in namespace {ns!r}; decorate classes once at import time",
+                RuntimeWarning,
+                stacklevel=2,
+            )
         _CONFIGURABLE_REGISTRY[ns] = metadata
+        # Keyed by definition, not identity, so re-running a class statement
+        # replaces its entry instead of adding another
+        _BY_NAMESPACE[ns] = tuple(
+            m
+            for m in _BY_NAMESPACE.get(ns, ())
+            if (m.cls.__module__, m.cls.__qualname__) != (cls.__module__, cls.__qualname__)
+        ) + (metadata,)
+        _REGISTRY_VERSION += 1
         
         # Store metadata on class for introspection
         cls.__configurable_metadata__ = metadata  # type: ignore
@@ -270,16 +572,17 @@ def configurable(
     return decorator
 
 
-def get_configurable_registry() -> dict[str, ConfigMetadata]:
-    """Get a copy of the configurable class registry.
+def get_configurable_registry() -> Mapping[str, ConfigMetadata]:
+    """Get a read-only view of the configurable class registry.
     
-    Returns a copy of the global registry mapping namespaces to
-    ConfigMetadata instances. The copy ensures the registry cannot
-    be accidentally modified.
+    Returns a live, read-only mapping of namespaces to ConfigMetadata
+    instances. The view cannot be modified and costs nothing to hand
+    out; it reflects classes registered after the call. Use
+    snapshot_registry() for an independent, mutable copy.
     
     Returns:
-        dict[str, ConfigMetadata]: Copy of registry mapping namespace
-                                   to metadata
+        Mapping[str, ConfigMetadata]: Read-only view mapping namespace
+                                      to metadata
     
     Example:
         >>> registry = get_configurable_registry()
@@ -288,18 +591,71 @@ def get_configurable_registry() -> dict[str, ConfigMetadata]:
         vast: VastUpstream
         openrtb: OpenRtbUpstream
     """
+    return _REGISTRY_VIEW
+
+
+def snapshot_registry() -> dict[str, ConfigMetadata]:
+    """Get a copy of the configurable class registry.
+
+    Returns:
+        dict[str, ConfigMetadata]: Point-in-time copy mapping namespace
+                                   to metadata
+    """
     return _CONFIGURABLE_REGISTRY.copy()
 
 
-def generate_toml_template() -> str:
+def get_configurable_by_namespace(namespace: str) -> tuple[ConfigMetadata, ...]:
+    """Get all configurable classes registered under a namespace.
+
+    Served from an index maintained at decoration time, so the lookup is
+    a single dict access rather than a scan of the registry.
+
+    Args:
+        namespace: Namespace to look up (e.g., "vast")
+
+    Returns:
+        tuple[ConfigMetadata, ...]: Metadata in registration order, or an
+                                    empty tuple if none are registered
+
+    Example:
+        >>> for metadata in get_configurable_by_namespace("vast"):
+        ...     print(metadata.cls.__name__)
+        VastUpstream
+    """
+    return _BY_NAMESPACE.get(namespace, ())
+
+
+def _sorted_namespaces() -> list[str]:
+    """Return registered namespaces in sorted order (do not mutate)."""
+    return _SORTED_NAMESPACES
+
+
+def _registry_version() -> int:
+    """Return the registry mutation counter, for keying derived caches."""
+    return _REGISTRY_VERSION
+
+
+def generate_toml_template(overrides: Mapping[str, Any] | None = None) -> str:
     """Generate TOML configuration template from registry.
     
     Creates a TOML template with all registered configurable classes
     and their parameters. Each class becomes a TOML section with its
     namespace, and parameters are listed with their default values.
     
+    The template is compiled once per registry version into static text
+    chunks with a slot per value. Without overrides the joined string is
+    cached until the next registration; with overrides only the named
+    slots are re-rendered.
+
+    Args:
+        overrides: Values to write instead of defaults, keyed by
+                   "namespace.parameter" (e.g. {"vast.enable_macros": False})
+
     Returns:
         str: TOML template string
+
+    Raises:
+        KeyError: If an override names an unknown namespace.parameter
         
     Example:
         >>> template = generate_toml_template()
@@ -316,35 +672,231 @@ def generate_toml_template() -> str:
         version = "2.5"
         timeout = 5.0
     """
-    lines: list[str] = []
+    global _TEMPLATE_CACHE
+    if overrides:
+        parts, slots = _template_parts(_REGISTRY_VERSION)
+        rendered = list(parts)
+        for key, value in overrides.items():
+            index = slots.get(key)
+            if index is None:
+                raise KeyError(f"Unknown configuration key: {key}")
+            rendered[index] = _value_to_toml(value)
+        return "".join(rendered)
     
-    for namespace, metadata in sorted(_CONFIGURABLE_REGISTRY.items()):
+    cached = _TEMPLATE_CACHE
+    if cached is not None and cached[0] == _REGISTRY_VERSION:
+        return cached[1]
+
+    template = "".join(_template_parts(_REGISTRY_VERSION)[0])
+    _TEMPLATE_CACHE = (_REGISTRY_VERSION, template)
+    return template
+
+
+def write_toml_template(stream: TextIO) -> None:
+    """Write the TOML configuration template to a text stream.
+
+    Same output as generate_toml_template(), written incrementally so a
+    file or socket can be filled without building the whole string.
+
+    Args:
+        stream: Writable text stream (open file, StringIO, sys.stdout)
+
+    Example:
+        >>> with open("xsp.toml", "w") as f:
+        ...     write_toml_template(f)
+    """
+    stream.writelines(_template_parts(_REGISTRY_VERSION)[0])
+
+
+@functools.lru_cache(maxsize=4)
+def _template_parts(version: int) -> tuple[tuple[str, ...], dict[str, int]]:
+    """Compile the template into static chunks plus value slot indexes.
+
+    Cached per ``_REGISTRY_VERSION``. Each parameter value occupies its own
+    chunk, so overrides can be applied by replacing single entries.
+
+    Args:
+        version: Current registry version (cache key)
+
+    Returns:
+        Tuple of (chunks, {"namespace.parameter": chunk index})
+    """
+    parts: list[str] = []
+    slots: dict[str, int] = {}
+    append = parts.append
+
+    for index, (namespace, metadata, params) in enumerate(_sorted_view(version)):
+        # Add blank line between sections
+        if index:
+            append("\n")
+
         # Add description comment if present
         if metadata.description:
-            lines.append(f"# {metadata.description}")
+            append(_format_toml_comment(metadata.description))
         
         # Add section header
-        lines.append(f"[{namespace}]")
+        append(f"[{_format_toml_key(namespace)}]\n")
         
-        # Add parameters
-        for param_name, param_info in sorted(metadata.parameters.items()):
-            # Convert default value to TOML format
-            value = _value_to_toml(param_info.default)
-            
+        # Add parameters; values were rendered once at decoration time
+        for param_name, param_info in params:
             # Add parameter description comment if present
             if param_info.description:
-                lines.append(f"# {param_info.description}")
+                append(_format_toml_comment(param_info.description))
             
-            lines.append(f"{param_name} = {value}")
+            append(f"{param_name} = ")
+            slots[f"{namespace}.{param_name}"] = len(parts)
+            append(param_info.toml_value)
+            append("\n")
+
+    return tuple(parts), slots
+
+
+_TYPING_RE = re.compile(r"\btyping\.")
+
+# Fast path for the annotations that make up most configurable parameters
+_BUILTIN_TYPE_NAMES: dict[Any, str] = {
+    int: "int",
+    str: "str",
+    float: "float",
+    bool: "bool",
+    bytes: "bytes",
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _format_type(type_hint: Any) -> str:
+    """Format a type annotation for display.
+
+    Shared by the decorator (to build ``ParameterInfo.type``) and by
+    ``ConfigGenerator``. Cached because the same handful of annotations
+    (str, int, bool, ...) repeat across every registered parameter.
+
+    Args:
+        type_hint: Type annotation or already-formatted string
         
-        # Add blank line between sections
-        lines.append("")
+    Returns:
+        str: Display name, e.g. ``"float"`` or ``"str | None"``
+    """
+    name = _BUILTIN_TYPE_NAMES.get(type_hint)
+    if name is not None:
+        return name
     
-    return "\\n".join(lines)
+    if isinstance(type_hint, str):
+        return type_hint
+
+    # Subscripted generics also carry __name__ ("Optional", "list"), which
+    # would drop their arguments, so only bare classes take the short path.
+    if hasattr(type_hint, "__name__") and not hasattr(type_hint, "__args__"):
+        return str(type_hint.__name__)
+
+    # str(typing.Optional[typing.List[int]]) qualifies every level; strip
+    # them all in one pass.
+    return _TYPING_RE.sub("", str(type_hint))
+
+
+@functools.lru_cache(maxsize=4)
+def _sorted_view(
+    version: int,
+) -> tuple[tuple[str, ConfigMetadata, tuple[tuple[str, ParameterInfo], ...]], ...]:
+    """Return the registry sorted by namespace, with parameters sorted by name.
+
+    Nothing is sorted here: namespaces are kept ordered by ``bisect.insort``
+    at registration and each ConfigMetadata sorts its parameters once. The
+    result is still cached per ``_REGISTRY_VERSION``.
+
+    Args:
+        version: Current registry version (cache key)
+
+    Returns:
+        Tuple of (namespace, metadata, sorted parameter items) entries
+    """
+    return tuple(
+        (
+            namespace,
+            _CONFIGURABLE_REGISTRY[namespace],
+            _CONFIGURABLE_REGISTRY[namespace].sorted_parameters,
+        )
+        for namespace in _SORTED_NAMESPACES
+    )
+
+
+# Escapes for TOML basic strings, applied in a single str.translate pass.
+# TOML forbids raw control characters, so everything else below 0x20 (and
+# DEL) is written as a \uXXXX escape.
+_TOML_STR_ESCAPES = str.maketrans({
+    **{chr(c): f"\\u{c:04X}" for c in (*range(0x20), 0x7F)},
+    "\\": "\\\\",
+    '"': '\\"',
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+})
+
+
+# Comments may hold any character but controls other than tab; those left
+# after splitting into lines are written as visible \uXXXX text
+_TOML_COMMENT_ESCAPES = str.maketrans({
+    chr(c): f"\\u{c:04X}" for c in (*range(0x09), *range(0x0A, 0x20), 0x7F)
+})
+
+# Keys matching this are written bare; anything else is quoted
+_TOML_BARE_KEY_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def _format_toml_str(value: str) -> str:
+    """Format a string as a quoted TOML basic string."""
+    return '"' + value.translate(_TOML_STR_ESCAPES) + '"'
+
+
+def _format_toml_key(key: Any) -> str:
+    """Format a table or section key, quoting it unless it is a bare key."""
+    text = str(key)
+    if _TOML_BARE_KEY_RE.fullmatch(text):
+        return text
+    return _format_toml_str(text)
+
+
+def _format_toml_comment(text: str) -> str:
+    """Format text as TOML comment lines, one "# " line per input line."""
+    return "".join(
+        "# " + line.translate(_TOML_COMMENT_ESCAPES) + "\n" for line in text.splitlines()
+    )
+
+
+def _format_toml_array(value: list[Any] | tuple[Any, ...]) -> str:
+    """Format a list or tuple as an inline TOML array."""
+    return "[" + ", ".join(map(_value_to_toml, value)) + "]"
+
+
+def _format_toml_table(value: dict[Any, Any]) -> str:
+    """Format a dict as an inline TOML table."""
+    return (
+        "{"
+        + ", ".join(f"{_format_toml_key(k)} = {_value_to_toml(v)}" for k, v in value.items())
+        + "}"
+    )
+
+
+# Exact-type formatters for the common defaults. Keyed on type(value), so
+# bool never falls through to the int formatter.
+_TOML_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    bool: lambda v: "true" if v else "false",
+    int: str,
+    float: str,
+    str: _format_toml_str,
+    type(None): lambda v: '""',
+    list: _format_toml_array,
+    tuple: _format_toml_array,
+    dict: _format_toml_table,
+}
 
 
 def _value_to_toml(value: Any) -> str:
     """Convert a Python value to TOML representation.
+
+    Scalars and plain containers are dispatched through ``_TOML_FORMATTERS``
+    with a single dict lookup; enums and subclasses fall back to isinstance
+    checks (no duck-typed ``hasattr`` probing).
     
     Args:
         value: Python value to convert
@@ -360,24 +912,61 @@ def _value_to_toml(value: Any) -> str:
         >>> _value_to_toml("hello")
         '"hello"'
     """
-    if isinstance(value, bool):
+    formatter = _TOML_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+
+    if isinstance(value, enum.Enum):
+        # Enum - use its value. Top-level enum defaults are already unwrapped
+        # by ParameterInfo; this covers members nested inside containers.
+        return _value_to_toml(value.value)
+    elif isinstance(value, bool):
         return "true" if value else "false"
     elif isinstance(value, (int, float)):
         return str(value)
     elif isinstance(value, str):
-        # Escape quotes in string
-        escaped = value.replace('"', '\\\\"')
-        return f'"{escaped}"'
-    elif hasattr(value, "value"):
-        # Enum - use its value
-        return _value_to_toml(value.value)
+        return _format_toml_str(value)
     elif isinstance(value, (list, tuple)):
-        items = [_value_to_toml(item) for item in value]
-        return f"[{', '.join(items)}]"
+        return _format_toml_array(value)
     elif isinstance(value, dict):
-        # Simple dict representation
-        items = [f"{k} = {_value_to_toml(v)}" for k, v in value.items()]
-        return f"{{{', '.join(items)}}}"
+        return _format_toml_table(value)
     else:
-        # Fallback to string representation
-        return f'"{str(value)}"'
+        # Fallback to string representation, escaped like any other string
+        return _format_toml_str(str(value))
+
+
+def _value_to_data(value: Any) -> Any:
+    """Convert a Python value to the plain data its TOML form parses back to.
+
+    Mirrors ``_value_to_toml``: enums become their value, None becomes "",
+    tuples become lists, table keys become strings, and anything else
+    falls back to ``str()``.
+
+    Args:
+        value: Python value to convert
+
+    Returns:
+        Any: Value as tomllib would return it
+
+    Example:
+        >>> _value_to_data((1, None))
+        [1, '']
+    """
+    if isinstance(value, enum.Enum):
+        return _value_to_data(value.value)
+    elif value is None:
+        return ""
+    elif isinstance(value, bool):
+        return bool(value)
+    elif isinstance(value, int):
+        return int(value)
+    elif isinstance(value, float):
+        return float(value)
+    elif isinstance(value, str):
+        return str(value)
+    elif isinstance(value, list | tuple):
+        return [_value_to_data(item) for item in value]
+    elif isinstance(value, dict):
+        return {str(k): _value_to_data(v) for k, v in value.items()}
+    else:
+        return str(value)
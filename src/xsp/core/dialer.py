@@ -24,8 +24,37 @@ Example:
     >>> await dialer.close()
 """
 
+import functools
 from typing import Any, Protocol
 
+# Resolved once at import: httpx is optional (xsp-lib[http]), so a missing
+# install only fails when an HttpDialer is actually constructed
+try:
+    import httpx as _httpx
+except ImportError:
+    _httpx = None  # type: ignore[assignment]
+
+# Pool defaults shared by every HttpDialer that doesn't override them
+_DEFAULT_POOL_LIMITS = {
+    "max_connections": 100,
+    "max_keepalive_connections": 20,
+}
+
+# httpx.Limits for _DEFAULT_POOL_LIMITS, built on first use (httpx is optional)
+_default_limits_obj: Any | None = None
+
+
+def _get_default_limits() -> Any:
+    """Return the shared default httpx.Limits, creating it once.
+
+    Returns:
+        httpx.Limits for the default pool configuration
+    """
+    global _default_limits_obj
+    if _default_limits_obj is None:
+        _default_limits_obj = _httpx.Limits(**_DEFAULT_POOL_LIMITS)
+    return _default_limits_obj
+
 
 class Dialer(Protocol):
     """Protocol for connection dialers to upstream services.
@@ -164,36 +193,47 @@ class HttpDialer:
         Raises:
             ImportError: If httpx is not installed
         """
-        try:
-            import httpx
-        except ImportError:
+        if _httpx is None:
             raise ImportError(
                 "httpx is required for HttpDialer. " "Install it with: pip install xsp-lib[http]"
             )
 
         if client is not None:
-            # Use provided client, ignore pool_limits and timeout
+            # Use provided client, ignore pool_limits and timeout. Assigning
+            # it shadows the lazy client property below.
             self.client = client
             self._owns_client = False
         else:
-            # Create client with pool configuration
-            default_limits = {
-                "max_connections": 100,
-                "max_keepalive_connections": 20,
-            }
-            limits = {**default_limits, **(pool_limits or {})}
+            # The AsyncClient is built on first access to .client, so
+            # dialers that are configured but never used stay cheap
+            self._pool_limits = pool_limits
+            self._timeout = timeout
+            self._owns_client = True
+
+    @functools.cached_property
+    def client(self) -> Any:
+        """httpx.AsyncClient for this dialer, created on first access.
+
+        Returns:
+            The pooled httpx.AsyncClient
+        """
+        # Create client with pool configuration
+        if not self._pool_limits:
+            # Common case: reuse the shared, read-only default Limits
+            limits_obj = _get_default_limits()
+        else:
+            limits = {**_DEFAULT_POOL_LIMITS, **self._pool_limits}
 
             # Create httpx.Limits object
-            limits_obj = httpx.Limits(
+            limits_obj = _httpx.Limits(
                 max_connections=limits["max_connections"],
                 max_keepalive_connections=limits["max_keepalive_connections"],
             )
 
-            self.client = httpx.AsyncClient(
-                limits=limits_obj,
-                timeout=timeout,
-            )
-            self._owns_client = True
+        return _httpx.AsyncClient(
+            limits=limits_obj,
+            timeout=self._timeout,
+        )
 
     async def close(self) -> None:
         """Close HTTP client and release all connections.
@@ -213,7 +253,9 @@ class HttpDialer:
             >>> # ... use dialer ...
             >>> await dialer.close()  # Clean shutdown
         """
-        if self._owns_client:
+        # A client that was never accessed was never created; don't build
+        # one just to close it
+        if self._owns_client and "client" in self.__dict__:
             await self.client.aclose()
 
     async def __aenter__(self) -> "HttpDialer":
@@ -1,17 +1,47 @@
-"""Core exceptions for xsp-lib."""
+"""Core exceptions for xsp-lib.
+
+Every exception declares ``__slots__``. BaseException only allocates its
+instance ``__dict__`` on first attribute assignment, so keeping
+``status_code`` in a slot lets the HTTP/transport errors raised on hot
+timeout and error paths skip that allocation entirely. Those errors also
+declare ``__match_args__`` so handlers can ``match`` on the status code,
+and ``__reduce__`` so the slotted code survives copy and pickle.
+"""
+
+from typing import Any
 
 
 class XspError(Exception):
     """Base exception for xsp-lib."""
 
+    __slots__ = ()
+
 
 class UpstreamError(XspError):
     """Upstream operation failed."""
 
+    __slots__ = ()
+
+
+class _StatusCodeReduceMixin:
+    """Rebuilds slotted status-code errors from (message, status_code) on copy/pickle."""
+
+    __slots__ = ()
+
+    args: tuple[Any, ...]
+    status_code: int | None
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # BaseException.__reduce__ only carries args and __dict__, not slots
+        return (type(self), (self.args[0], self.status_code), self.__dict__ or None)
 
-class TransportError(XspError):
+
+class TransportError(_StatusCodeReduceMixin, XspError):
     """Transport layer error."""
 
+    __slots__ = ("status_code",)
+    __match_args__ = ("status_code",)
+
     def __init__(self, message: str, status_code: int | None = None):
         super().__init__(message)
         self.status_code = status_code
@@ -20,46 +50,74 @@ class TransportError(XspError):
 class TransportTimeoutError(TransportError):
     """Request timed out."""
 
+    __slots__ = ()
+
 
 class TransportConnectionError(TransportError):
     """Connection failed."""
 
+    __slots__ = ()
+
 
-class UpstreamTimeout(UpstreamError):  # noqa: N818
+class UpstreamTimeoutError(UpstreamError):
     """Upstream request timed out."""
 
+    __slots__ = ()
+
+
+# Original name, kept as an alias so existing imports and except clauses
+# keep matching the same class
+UpstreamTimeout = UpstreamTimeoutError
+
 
 class DecodeError(UpstreamError):
     """Failed to decode response."""
 
+    __slots__ = ()
+
 
 class ValidationError(XspError):
     """Schema validation failed."""
 
+    __slots__ = ()
+
 
 class FrequencyCapExceeded(XspError):  # noqa: N818
     """Frequency cap limit exceeded."""
 
+    __slots__ = ()
+
 
 class BudgetExceeded(XspError):  # noqa: N818
     """Budget limit exceeded."""
 
+    __slots__ = ()
+
 
 class VastError(UpstreamError):
     """VAST protocol error."""
 
+    __slots__ = ()
+
 
 class VastTimeoutError(VastError):
     """VAST request timed out."""
 
+    __slots__ = ()
+
 
 class VastNetworkError(VastError):
     """VAST network error."""
 
+    __slots__ = ()
 
-class VastHttpError(VastError):
+
+class VastHttpError(_StatusCodeReduceMixin, VastError):
     """VAST HTTP error."""
 
+    __slots__ = ("status_code",)
+    __match_args__ = ("status_code",)
+
     def __init__(self, message: str, status_code: int):
         super().__init__(message)
         self.status_code = status_code
@@ -68,22 +126,33 @@ class VastHttpError(VastError):
 class VastParseError(VastError):
     """VAST XML parsing error."""
 
+    __slots__ = ()
+
 
 class OpenRTBError(UpstreamError):
     """OpenRTB protocol error."""
 
+    __slots__ = ()
+
 
 class OpenRTBTimeoutError(OpenRTBError):
     """OpenRTB request timed out."""
 
+    __slots__ = ()
+
 
 class OpenRTBNetworkError(OpenRTBError):
     """OpenRTB network error."""
 
+    __slots__ = ()
+
 
-class OpenRTBHttpError(OpenRTBError):
+class OpenRTBHttpError(_StatusCodeReduceMixin, OpenRTBError):
     """OpenRTB HTTP error."""
 
+    __slots__ = ("status_code",)
+    __match_args__ = ("status_code",)
+
     def __init__(self, message: str, status_code: int):
         super().__init__(message)
         self.status_code = status_code
@@ -92,6 +161,10 @@ class OpenRTBHttpError(OpenRTBError):
 class OpenRTBParseError(OpenRTBError):
     """OpenRTB JSON parsing error."""
 
+    __slots__ = ()
+
 
 class OpenRTBNoBidError(OpenRTBError):
     """No bid received from bidder."""
+
+    __slots__ = ()
@@ -1,22 +1,27 @@
 """Session management for tracking request context and state."""
 
-import asyncio
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Protocol, TypeVar
 
+from xsp.protocols.vast.cache import VastCacheLayer
 from xsp.protocols.vast.upstream import VastUpstream
 
 T = TypeVar("T", covariant=True)
 
+# Error records kept per VastSession; older entries are discarded first
+_MAX_TRACKED_ERRORS = 256
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SessionContext:
     """
     Immutable session context for request tracking.
 
     Stores request metadata that should not change during the session lifecycle.
-    Immutability is enforced via @dataclass(frozen=True).
+    Immutability is enforced via @dataclass(frozen=True); slots=True drops the
+    per-instance __dict__, since a context is built for every request.
 
     Attributes:
         request_id: Unique identifier for the request
@@ -42,13 +47,16 @@ class SessionContext:
     Note:
         While the dataclass is frozen, the metadata dict itself is mutable.
         For true immutability, avoid modifying metadata after creation.
+        Hashing ignores metadata, so contexts can be used as dict keys.
     """
 
     request_id: str
     user_id: str | None
     ip_address: str | None
     timestamp: datetime
-    metadata: dict[str, Any] = field(default_factory=dict)
+    # Left out of __hash__ (still compared by __eq__) so contexts are
+    # hashable and can key per-request caches despite the dict field
+    metadata: dict[str, Any] = field(default_factory=dict, hash=False)
 
 
 class UpstreamSession(Protocol[T]):
@@ -69,7 +77,8 @@ class UpstreamSession(Protocol[T]):
 
     Thread Safety:
         Implementations must ensure thread-safe state updates when used
-        concurrently. Consider using asyncio.Lock for state modifications.
+        concurrently. Use asyncio.Lock when a state update spans an await;
+        updates with no await point in between are already atomic.
 
     Example:
         >>> session: UpstreamSession[str] = VastSession(...)
@@ -143,12 +152,15 @@ class VastSession:
     State Tracking:
         - request_count: Total number of requests made
         - last_request_time: Timestamp of most recent request
-        - errors: List of error messages encountered
+        - errors: Most recent error records (oldest dropped past 256)
         - total_bytes: Total bytes fetched (if trackable)
+        - cache_hits: Fetches served from the response cache, if one is set
 
     Thread Safety:
-        State updates are protected by asyncio.Lock to ensure thread-safe
-        concurrent access. Multiple coroutines can safely share a VastSession.
+        State updates run without any await point between reading and
+        writing, so they are atomic with respect to other coroutines on the
+        event loop and need no lock. Multiple coroutines can safely share a
+        VastSession; it is not meant to be shared across OS threads.
 
     Example:
         >>> from datetime import datetime
@@ -184,13 +196,24 @@ class VastSession:
         state: Mutable state dictionary
     """
 
-    def __init__(self, upstream: VastUpstream, context: SessionContext) -> None:
+    def __init__(
+        self,
+        upstream: VastUpstream,
+        context: SessionContext,
+        cache: VastCacheLayer | None = None,
+    ) -> None:
         """
         Initialize VAST session.
 
         Args:
             upstream: VastUpstream instance to wrap
-            context: Immutable session context
+            context: Immutable session context. Its fields and metadata
+                are captured here; later edits to context.metadata are not
+                seen by fetch().
+            cache: Optional response cache. Identical fetches (same params,
+                headers, merged context and extra arguments) within its TTL
+                are served without an upstream request. Off by default,
+                since ad responses are usually meant to be fresh per request.
 
         Example:
             >>> ctx = SessionContext(
@@ -204,13 +227,24 @@ class VastSession:
         """
         self.upstream = upstream
         self._context = context
+        self._cache = cache
+        # Session part of every request's macro context, built once. Fetches
+        # get a copy, since downstream code expects a plain, mutable dict.
+        self._base_context: dict[str, Any] = {
+            "request_id": context.request_id,
+            "user_id": context.user_id,
+            "ip_address": context.ip_address,
+            **context.metadata,
+        }
         self._state: dict[str, Any] = {
             "request_count": 0,
             "last_request_time": None,
-            "errors": [],
+            # Bounded so long-lived sessions with sustained failures don't
+            # grow without limit
+            "errors": deque(maxlen=_MAX_TRACKED_ERRORS),
             "total_bytes": 0,
+            "cache_hits": 0,
         }
-        self._lock = asyncio.Lock()
 
     @property
     def context(self) -> SessionContext:
@@ -236,15 +270,15 @@ class VastSession:
         Returns:
             State dictionary with request statistics
 
-        Warning:
-            Direct modifications to this dict are not protected by the lock.
-            Use the provided methods for thread-safe updates.
+        Note:
+            This is the live dict fetch() updates, not a snapshot; writes
+            to it are kept.
 
         Example:
             >>> session.state["request_count"]
             5
             >>> session.state["errors"]
-            []
+            deque([], maxlen=256)
         """
         return self._state
 
@@ -296,13 +330,20 @@ class VastSession:
             datetime(...)
         """
         # Merge session context into request context
-        merged_context = {
-            "request_id": self._context.request_id,
-            "user_id": self._context.user_id,
-            "ip_address": self._context.ip_address,
-            **(self._context.metadata or {}),
-            **(context or {}),
-        }
+        base_context = self._base_context
+        merged_context = {**base_context, **context} if context else base_context.copy()
+
+        # Serve repeated identical fetches (retries, several slots resolving
+        # the same wrapper) from the cache without touching the upstream
+        cache = self._cache
+        cache_key = None
+        if cache is not None:
+            cache_key = self._cache_key(cache, params, headers, merged_context, kwargs)
+            if cache_key is not None:
+                cached = await cache.get(cache_key)
+                if isinstance(cached, str):
+                    self._state["cache_hits"] += 1
+                    return cached
 
         try:
             # Fetch from upstream
@@ -314,28 +355,57 @@ class VastSession:
                 **kwargs,
             )
 
-            # Update state (thread-safe)
-            async with self._lock:
-                self._state["request_count"] += 1
-                self._state["last_request_time"] = datetime.now()
-                # Track approximate response size
-                if isinstance(result, str):
-                    self._state["total_bytes"] += len(result.encode("utf-8"))
-
-            return result
+            # Update state. No await between read and write, so no other
+            # coroutine can interleave and no lock is needed.
+            state = self._state
+            state["request_count"] += 1
+            state["last_request_time"] = datetime.now()
+            # Track response size in UTF-8 bytes. isascii() is a constant-time
+            # flag check, and for ASCII text (nearly all VAST XML) the byte
+            # count equals len(), so only non-ASCII responses are encoded.
+            if isinstance(result, str):
+                state["total_bytes"] += (
+                    len(result) if result.isascii() else len(result.encode("utf-8"))
+                )
 
         except Exception as e:
-            # Track errors (thread-safe)
-            async with self._lock:
-                self._state["errors"].append(
-                    {
-                        "timestamp": datetime.now(),
-                        "error": str(e),
-                        "type": type(e).__name__,
-                    }
-                )
+            # Track errors (atomic for the same reason)
+            self._state["errors"].append(
+                {
+                    "timestamp": datetime.now(),
+                    "error": str(e),
+                    "type": type(e).__name__,
+                }
+            )
             raise
 
+        # Outside the try: a cache failure is not an upstream fetch error
+        if cache is not None and cache_key is not None:
+            await cache.set(cache_key, result)
+
+        return result
+
+    @staticmethod
+    def _cache_key(
+        cache: VastCacheLayer,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        context: dict[str, Any],
+        kwargs: dict[str, Any],
+    ) -> str | None:
+        """
+        Build the response cache key for a fetch.
+
+        Returns:
+            Cache key, or None if an argument is not JSON-serializable
+            (unsupported type or circular reference), in which case the
+            fetch bypasses the cache
+        """
+        try:
+            return cache.generate_key(params=params, headers=headers, context=context, **kwargs)
+        except (TypeError, ValueError):
+            return None
+
     async def close(self) -> None:
         """
         Close upstream and cleanup session resources.
@@ -20,8 +20,13 @@ from xsp.core.exceptions import BudgetExceeded
 from xsp.core.upstream import Upstream
 from xsp.middleware.base import FetchFunc
 
+# Decimal constants shared by every check instead of being parsed from a
+# string on each call; Decimal is immutable, so sharing is safe
+_ZERO = Decimal(0)
+_MILLE = Decimal(1000)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Budget:
     """
     Budget configuration for ad spend tracking.
@@ -72,9 +77,9 @@ class Budget:
 
     def __post_init__(self) -> None:
         """Validate budget configuration."""
-        if self.total_budget < Decimal("0"):
+        if self.total_budget < _ZERO:
             raise ValueError("total_budget must be non-negative")
-        if self.spent < Decimal("0"):
+        if self.spent < _ZERO:
             raise ValueError("spent must be non-negative")
         if len(self.currency) != 3:
             raise ValueError("currency must be 3-letter ISO 4217 code (e.g., USD)")
@@ -261,7 +266,7 @@ class InMemoryBudgetStore:
             >>> updated.spent
             Decimal('50.25')
         """
-        if amount < Decimal("0"):
+        if amount < _ZERO:
             raise ValueError("amount must be non-negative")
 
         async with self._lock:
@@ -303,7 +308,7 @@ class InMemoryBudgetStore:
             # Create new Budget with spent reset to zero
             reset_budget = Budget(
                 total_budget=budget.total_budget,
-                spent=Decimal("0"),
+                spent=_ZERO,
                 currency=budget.currency,
                 campaign_id=budget.campaign_id,
             )
@@ -449,7 +454,7 @@ class BudgetTrackingMiddleware:
             ... )
         """
         self.store = store
-        self.default_cost = default_cost if default_cost is not None else Decimal("0")
+        self.default_cost = default_cost if default_cost is not None else _ZERO
         self.per_campaign = per_campaign
 
     def _build_key(self, campaign_id: str | None = None) -> str:
@@ -556,7 +561,7 @@ class BudgetTrackingMiddleware:
             cpm = kwargs["cpm"]
             cpm_decimal = Decimal(str(cpm)) if not isinstance(cpm, Decimal) else cpm
             # CPM = cost per 1000 impressions, so divide by 1000 for single impression
-            return cpm_decimal / Decimal("1000")
+            return cpm_decimal / _MILLE
 
         # Default cost
         return self.default_cost
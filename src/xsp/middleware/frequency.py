@@ -20,7 +20,7 @@ from xsp.core.upstream import Upstream
 from xsp.middleware.base import FetchFunc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FrequencyCap:
     """
     Frequency cap rule definition.
@@ -325,13 +325,28 @@ class FrequencyCappingMiddleware:
         - VAST 4.2: User experience best practices
     """
 
-    def __init__(self, cap: FrequencyCap, store: FrequencyStore):
+    # Upper bound on locally remembered "cap exceeded" keys
+    _EXCEEDED_CACHE_MAXSIZE = 100_000
+
+    def __init__(
+        self,
+        cap: FrequencyCap,
+        store: FrequencyStore,
+        *,
+        exceeded_cache_ttl: float = 0.0,
+    ):
         """
         Initialize frequency capping middleware.
 
         Args:
             cap: Frequency cap configuration
             store: Storage backend for impression tracking
+            exceeded_cache_ttl: Seconds to remember locally that a key is
+                over its cap, rejecting repeat requests without a store
+                round trip. The store cannot report when its window ends,
+                so a rejection may outlive the window (or a store reset)
+                by up to this long; capped at the cap's window. Defaults to
+                0 (disabled), so every request reads the store.
 
         Example:
             >>> cap = FrequencyCap(max_impressions=5, time_window_seconds=3600)
@@ -340,6 +355,9 @@ class FrequencyCappingMiddleware:
         """
         self.cap = cap
         self.store = store
+        self._exceeded_ttl = min(exceeded_cache_ttl, cap.time_window_seconds)
+        # key -> time.monotonic() deadline until which the key is known capped
+        self._exceeded_until: dict[str, float] = {}
 
     def _build_key(self, user_id: str, campaign_id: str | None = None) -> str:
         """
@@ -362,6 +380,24 @@ class FrequencyCappingMiddleware:
             return f"freq:user:{user_id}:campaign:{campaign_id}"
         return f"freq:user:{user_id}"
 
+    def _remember_exceeded(self, key: str) -> None:
+        """
+        Record that key is at its cap for the next exceeded_cache_ttl seconds.
+
+        Args:
+            key: Storage key that was found at or over the cap
+        """
+        now = time.monotonic()
+        exceeded = self._exceeded_until
+        if len(exceeded) >= self._EXCEEDED_CACHE_MAXSIZE:
+            # Drop lapsed entries; if everything is still live, start over
+            # rather than grow without bound
+            for stale in [k for k, until in exceeded.items() if until <= now]:
+                del exceeded[stale]
+            if len(exceeded) >= self._EXCEEDED_CACHE_MAXSIZE:
+                exceeded.clear()
+        exceeded[key] = now + self._exceeded_ttl
+
     def _extract_user_id(self, kwargs: dict[str, Any]) -> str | None:
         """
         Extract user_id from request kwargs.
@@ -484,11 +520,25 @@ class FrequencyCappingMiddleware:
         # Build storage key
         key = self._build_key(user_id, campaign_id)
 
+        # Repeat offenders: a recent store read already showed this key at
+        # its cap, so reject without another round trip
+        exceeded_until = self._exceeded_until.get(key)
+        if exceeded_until is not None:
+            if time.monotonic() < exceeded_until:
+                raise FrequencyCapExceeded(
+                    f"Frequency cap exceeded for {key}: recently found at or over "
+                    f"{self.cap.max_impressions} impressions "
+                    f"in {self.cap.time_window_seconds}s window"
+                )
+            del self._exceeded_until[key]
+
         # Check current count
         current_count = await self.store.get_count(key)
 
         # Enforce cap
         if current_count >= self.cap.max_impressions:
+            if self._exceeded_ttl > 0:
+                self._remember_exceeded(key)
             raise FrequencyCapExceeded(
                 f"Frequency cap exceeded for {key}: "
                 f"{current_count}/{self.cap.max_impressions} impressions "
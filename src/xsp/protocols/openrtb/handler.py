@@ -7,6 +7,7 @@ References:
     - OpenRTB 2.6 Specification: https://www.iab.com/wp-content/uploads/2016/03/OpenRTB-API-Specification-Version-2-6-FINAL.pdf
 """
 
+import os
 import uuid
 
 from xsp.core.exceptions import OpenRTBNoBidError
@@ -193,11 +194,15 @@ class OpenRTBProtocolHandler(ProtocolHandler):
         References:
             OpenRTB 2.6 §3.2 - Object Model
         """
-        # Generate unique request ID
-        request_id = str(uuid.uuid4())
+        # Generate unique request and impression IDs (random UUID4s) from a
+        # single urandom read instead of one per uuid.uuid4() call
+        raw = os.urandom(32)
+        request_id = str(uuid.UUID(bytes=raw[:16], version=4))
 
         # Build impression object
-        impression = self._build_impression(request)
+        impression = self._build_impression(
+            request, imp_id=str(uuid.UUID(bytes=raw[16:], version=4))
+        )
 
         # Build device object
         device = self._build_device(request)
@@ -229,11 +234,12 @@ class OpenRTBProtocolHandler(ProtocolHandler):
 
         return bid_request
 
-    def _build_impression(self, request: AdRequest) -> Impression:
+    def _build_impression(self, request: AdRequest, imp_id: str | None = None) -> Impression:
         """Build impression object from AdRequest.
 
         Args:
             request: Ad request
+            imp_id: Impression ID; a new UUID4 is generated if omitted
 
         Returns:
             OpenRTB Impression object
@@ -242,7 +248,8 @@ class OpenRTBProtocolHandler(ProtocolHandler):
             OpenRTB 2.6 §3.2.4 - Impression Object
         """
         # Generate unique impression ID
-        imp_id = str(uuid.uuid4())
+        if imp_id is None:
+            imp_id = str(uuid.uuid4())
 
         impression: Impression = {
             "id": imp_id,
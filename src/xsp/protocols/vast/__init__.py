@@ -16,7 +16,11 @@ from xsp.protocols.vast.types import (
     VastVersion,
 )
 from xsp.protocols.vast.upstream import VastUpstream, VmapUpstream
-from xsp.protocols.vast.validation import VastValidationError, validate_vast_xml
+from xsp.protocols.vast.validation import (
+    VastValidationError,
+    validate_vast_xml,
+    validate_vast_xml_or_none,
+)
 from xsp.protocols.vast.error_tracker import VastErrorCode, VastErrorTracker
 from xsp.protocols.vast.cache import VastCacheLayer
 from xsp.protocols.vast.metrics import VastMetrics, VastMetricLabels
@@ -37,6 +41,7 @@ __all__ = [
     "VastVersion",
     "VmapUpstream",
     "validate_vast_xml",
+    "validate_vast_xml_or_none",
     "VastErrorCode",
     "VastErrorTracker",
     "VastCacheLayer",
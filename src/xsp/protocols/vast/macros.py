@@ -1,6 +1,8 @@
 """IAB standard macro substitution for VAST URLs."""
 
+import functools
 import random
+import sys
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -9,6 +11,24 @@ from urllib.parse import quote
 from .types import VastVersion
 
 
+@functools.lru_cache(maxsize=256)
+def _macro_pattern(name: str) -> str:
+    """Return the interned "[NAME]" placeholder for a macro name."""
+    return sys.intern(f"[{name}]")
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_value(value: str) -> str:
+    """Percent-encode a macro value with safe chars for query params.
+
+    Session values (request and user IDs, metadata) are substituted into
+    every request and wrapper hop, so their encoded form is cached. The
+    cache is keyed by value only; per-request macros ([TIMESTAMP],
+    [CACHEBUSTING]) are still generated fresh on every substitution.
+    """
+    return quote(value, safe="-_.~")
+
+
 @dataclass
 class MacroDefinition:
     name: str
@@ -35,7 +55,7 @@ class MacroSubstitutor:
     MACRO_REGISTRY: dict[str, MacroDefinition] = {
         "TIMESTAMP": MacroDefinition(
             name="TIMESTAMP",
-            provider=lambda: str(int(time.time() * 1000)),
+            provider=lambda: str(time.time_ns() // 1_000_000),
             intro_version=VastVersion.V2_0,
             ssai_recommended=True,
         ),
@@ -119,28 +139,36 @@ class MacroSubstitutor:
         Returns:
             URL with macros replaced and URL-encoded
         """
+        # No placeholder at all: nothing to substitute (common for
+        # already-expanded wrapper URLs)
+        if "[" not in url:
+            return url
+
         result = url
 
-        # Built-in macros (filtered by version and SSAI mode)
+        # Built-in macros (filtered by version and SSAI mode); placeholders
+        # are built and interned once per macro name, not per call
         for macro, provider in self.providers.items():
-            pattern = f"[{macro}]"
+            pattern = _macro_pattern(macro)
             if pattern in result:
                 value = provider()
-                # Use safe chars appropriate for query params
-                result = result.replace(pattern, quote(value, safe="-_.~"))
+                # Numeric macros ([TIMESTAMP], [CACHEBUSTING]) never need
+                # percent-encoding; otherwise use safe chars for query params
+                if not (value.isascii() and value.isdigit()):
+                    value = _encode_value(value)
+                result = result.replace(pattern, value)
 
         # Context macros (with version filtering)
         if context:
             for key, value in context.items():
                 macro_name = key.upper()
-                pattern = f"[{macro_name}]"
+                pattern = _macro_pattern(macro_name)
                 if pattern in result:
                     # Check if this is a known macro that needs version filtering
                     if macro_name in self.MACRO_REGISTRY:
                         macro_def = self.MACRO_REGISTRY[macro_name]
                         if not self._is_macro_compatible(macro_def):
                             continue
-                    # Use safe chars appropriate for query params
-                    result = result.replace(pattern, quote(str(value), safe="-_.~"))
+                    result = result.replace(pattern, _encode_value(str(value)))
 
         return result
@@ -10,6 +10,26 @@ class VastValidationError(ValidationError):
     """VAST XML validation failed."""
 
 
+def _structure_error(root: ET.Element) -> str | None:
+    """Return why a parsed document is not VAST/VMAP, or None if it is."""
+    if root.tag != "VAST" and root.tag != "VMAP":
+        return f"Root element must be VAST or VMAP, got {root.tag}"
+
+    if root.tag == "VAST" and not root.get("version"):
+        return "VAST version attribute missing"
+
+    return None
+
+
+def _summarize(root: ET.Element) -> dict[str, Any]:
+    """Build the basic structure summary for a valid document."""
+    return {
+        "version": root.get("version"),
+        "has_ads": root.find(".//Ad") is not None,
+        "root_tag": root.tag,
+    }
+
+
 def validate_vast_xml(xml: str) -> dict[str, Any]:
     """
     Validate VAST XML structure.
@@ -28,15 +48,34 @@ def validate_vast_xml(xml: str) -> dict[str, Any]:
     except ET.ParseError as e:
         raise VastValidationError(f"Invalid XML: {e}") from e
 
-    if root.tag != "VAST" and root.tag != "VMAP":
-        raise VastValidationError(f"Root element must be VAST or VMAP, got {root.tag}")
+    error = _structure_error(root)
+    if error is not None:
+        raise VastValidationError(error)
 
-    version = root.get("version")
-    if not version and root.tag == "VAST":
-        raise VastValidationError("VAST version attribute missing")
+    return _summarize(root)
 
-    return {
-        "version": version,
-        "has_ads": len(root.findall(".//Ad")) > 0,
-        "root_tag": root.tag,
-    }
+
+def validate_vast_xml_or_none(xml: str) -> dict[str, Any] | None:
+    """
+    Validate VAST XML structure, returning None instead of raising.
+
+    For hot paths where malformed or truncated upstream responses are
+    expected: structural problems are detected with plain checks, so only
+    a parser failure goes through exception handling, and callers branch
+    on None instead of catching VastValidationError.
+
+    Args:
+        xml: VAST XML string
+
+    Returns:
+        Same structure as validate_vast_xml(), or None if XML is invalid
+    """
+    try:
+        root = ET.fromstring(xml)
+    except ET.ParseError:
+        return None
+
+    if _structure_error(root) is not None:
+        return None
+
+    return _summarize(root)
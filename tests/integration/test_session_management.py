@@ -17,6 +17,7 @@ References:
 import asyncio
 from datetime import datetime
 from decimal import Decimal
+from typing import Any
 
 import pytest
 
@@ -29,6 +30,7 @@ from xsp.middleware.frequency import (
     FrequencyCappingMiddleware,
     InMemoryFrequencyStore,
 )
+from xsp.protocols.vast.cache import VastCacheLayer
 from xsp.protocols.vast.upstream import VastUpstream
 from xsp.transports.memory import MemoryTransport
 
@@ -182,6 +184,28 @@ async def test_session_context_with_empty_metadata():
     assert isinstance(ctx.metadata, dict)
 
 
+def test_session_context_is_hashable():
+    """Test that SessionContext can key caches despite its metadata dict."""
+    now = datetime.now()
+    ctx = SessionContext(
+        request_id="req-001",
+        user_id="user-001",
+        ip_address=None,
+        timestamp=now,
+        metadata={"campaign_id": "c1"},
+    )
+    same = SessionContext(
+        request_id="req-001",
+        user_id="user-001",
+        ip_address=None,
+        timestamp=now,
+        metadata={"campaign_id": "c1"},
+    )
+
+    assert hash(ctx) == hash(same)
+    assert {ctx: 1}[same] == 1
+
+
 # 2. VastSession State Tracking Tests
 
 
@@ -283,6 +307,35 @@ async def test_vast_session_tracks_errors(session_context: SessionContext):
     await session.close()
 
 
+@pytest.mark.asyncio
+async def test_vast_session_error_history_is_bounded(session_context: SessionContext):
+    """Test that only the 256 most recent errors are kept, oldest dropped first."""
+
+    class FailingUpstream:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def fetch(self, **kwargs: Any) -> str:
+            self.calls += 1
+            raise TransportError(f"transport failure {self.calls}")
+
+        async def close(self) -> None:
+            pass
+
+    session = VastSession(FailingUpstream(), session_context)  # type: ignore[arg-type]
+
+    for _ in range(300):
+        with pytest.raises(TransportError):
+            await session.fetch()
+
+    errors = session.state["errors"]
+    assert len(errors) == 256
+    assert errors[0]["error"] == "transport failure 45"
+    assert errors[-1]["error"] == "transport failure 300"
+
+    await session.close()
+
+
 @pytest.mark.asyncio
 async def test_vast_session_tracks_total_bytes(vast_session: VastSession):
     """Test that VastSession tracks total bytes fetched.
@@ -306,6 +359,96 @@ async def test_vast_session_tracks_total_bytes(vast_session: VastSession):
     assert bytes_after_second == bytes_after_first * 2
 
 
+@pytest.mark.asyncio
+async def test_vast_session_total_bytes_counts_utf8(session_context: SessionContext):
+    """Test that total_bytes counts UTF-8 bytes for ASCII and non-ASCII responses."""
+
+    class StaticUpstream:
+        def __init__(self, body: str):
+            self.body = body
+
+        async def fetch(self, **kwargs: Any) -> str:
+            return self.body
+
+        async def close(self) -> None:
+            pass
+
+    for xml in (VAST_XML_SAMPLE, VAST_XML_SAMPLE.replace("Test Ad</", "Tést Àd ✓</")):
+        session = VastSession(StaticUpstream(xml), session_context)  # type: ignore[arg-type]
+        await session.fetch()
+        assert session.state["total_bytes"] == len(xml.encode("utf-8"))
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_vast_session_response_cache(session_context: SessionContext):
+    """Test that an opt-in response cache serves identical fetches without the upstream."""
+
+    class CountingUpstream:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def fetch(self, **kwargs: Any) -> str:
+            self.calls += 1
+            return VAST_XML_SAMPLE
+
+        async def close(self) -> None:
+            pass
+
+    upstream = CountingUpstream()
+    session = VastSession(upstream, session_context, cache=VastCacheLayer())  # type: ignore[arg-type]
+
+    assert await session.fetch(params={"w": "640"}) == VAST_XML_SAMPLE
+    assert await session.fetch(params={"w": "640"}) == VAST_XML_SAMPLE
+    assert upstream.calls == 1
+    assert session.state["cache_hits"] == 1
+    assert session.state["request_count"] == 1
+
+    # Different params, or unserializable arguments, go to the upstream
+    await session.fetch(params={"w": "1280"})
+    await session.fetch(params={"w": "640"}, context={"when": datetime.now()})
+    assert upstream.calls == 3
+
+    # Without a cache every fetch reaches the upstream
+    uncached = VastSession(upstream, session_context)  # type: ignore[arg-type]
+    await uncached.fetch(params={"w": "640"})
+    await uncached.fetch(params={"w": "640"})
+    assert upstream.calls == 5
+    assert uncached.state["cache_hits"] == 0
+
+    # Circular structures can't be keyed either; they bypass the cache
+    circular: dict[str, Any] = {}
+    circular["self"] = circular
+    await session.fetch(params={"w": "640"}, context={"loop": circular})
+    assert upstream.calls == 6
+
+
+@pytest.mark.asyncio
+async def test_vast_session_cache_failure_is_not_a_fetch_error(
+    session_context: SessionContext,
+):
+    """Test that a failing cache write is not recorded as an upstream error."""
+
+    class StaticUpstream:
+        async def fetch(self, **kwargs: Any) -> str:
+            return VAST_XML_SAMPLE
+
+        async def close(self) -> None:
+            pass
+
+    class FailingCache(VastCacheLayer):
+        async def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+            raise RuntimeError("cache unavailable")
+
+    session = VastSession(StaticUpstream(), session_context, cache=FailingCache())  # type: ignore[arg-type]
+
+    with pytest.raises(RuntimeError, match="cache unavailable"):
+        await session.fetch(params={"w": "640"})
+
+    assert session.state["request_count"] == 1
+    assert len(session.state["errors"]) == 0
+
+
 @pytest.mark.asyncio
 async def test_vast_session_thread_safety_concurrent_requests(
     vast_upstream: VastUpstream, session_context: SessionContext
@@ -899,3 +1042,26 @@ async def test_session_preserves_context_in_fetch(
     # that merging is working correctly.
 
     await session.close()
+
+
+@pytest.mark.asyncio
+async def test_session_merges_context_without_sharing_base(session_context: SessionContext):
+    """Test that each fetch gets its own merged context dict."""
+    seen: list[dict[str, Any]] = []
+
+    class RecordingUpstream:
+        async def fetch(self, *, context: dict[str, Any], **kwargs: Any) -> str:
+            seen.append(context)
+            context["mutated_downstream"] = True
+            return "<VAST/>"
+
+    session = VastSession(RecordingUpstream(), session_context)  # type: ignore[arg-type]
+
+    await session.fetch()
+    await session.fetch(context={"user_id": "override", "extra": 1})
+
+    assert seen[0]["request_id"] == session_context.request_id
+    assert seen[1]["user_id"] == "override"
+    assert seen[1]["extra"] == 1
+    assert seen[0] is not seen[1]
+    assert "mutated_downstream" not in session._base_context
@@ -212,4 +212,3 @@ def test_base_upstream_config_priority() -> None:
     assert upstream.endpoint == "https://config.example.com"
     assert upstream.default_params == {"from": "config"}
     assert upstream.default_timeout == 120.0
-
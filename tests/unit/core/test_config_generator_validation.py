@@ -101,7 +101,7 @@ def test_complex_types_with_signature_defaults() -> None:
     """Test TOML generation with lists and dicts in signature defaults.
 
     Note: Using mutable defaults in production code is discouraged.
-    This test verifies that tomlkit can handle such cases if they exist.
+    This test verifies that the generator can handle such cases if they exist.
     """
 
     @configurable(namespace="complex2")
@@ -190,7 +190,7 @@ def test_validation_can_be_disabled() -> None:
 
 def test_validation_raises_on_invalid_toml() -> None:
     """Test that validation raises ValueError on invalid TOML."""
-    # This is hard to test directly since tomlkit should always generate valid TOML
+    # This is hard to test directly since the generator should always emit valid TOML
     # But we can test the validation method directly
     invalid_toml = 'invalid = "unclosed string'
 
@@ -198,6 +198,26 @@ def test_validation_raises_on_invalid_toml() -> None:
         ConfigGenerator._validate_toml(invalid_toml)
 
 
+def test_validation_enabled_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that generate_toml validates by default, once per rendered template."""
+    import xsp.core.config_generator as config_generator
+
+    @configurable(namespace="default_validate")
+    class DefaultValidateClass:
+        def __init__(self, *, value: str = "test") -> None:
+            pass
+
+    parsed: list[str] = []
+    monkeypatch.setattr(config_generator, "_toml_loads", parsed.append)
+
+    ConfigGenerator.generate_toml()
+    ConfigGenerator.generate_toml()
+    assert len(parsed) == 1
+
+    ConfigGenerator.generate_toml(validate=False, include_defaults=False)
+    assert len(parsed) == 1
+
+
 def test_empty_string_default() -> None:
     """Test TOML generation with empty string default."""
 
@@ -283,3 +303,46 @@ def test_special_toml_reserved_characters() -> None:
     assert parsed["reserved"]["brackets"] == "[test]"
     assert parsed["reserved"]["hash"] == "# comment"
     assert parsed["reserved"]["equals"] == "key=value"
+
+
+def test_generate_config_cli_validates_by_default(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that the CLI validates unless --no-validate is passed."""
+    import sys
+
+    pytest.importorskip("httpx")
+    from xsp.cli import generate_config
+
+    calls: list[str] = []
+    monkeypatch.setattr(ConfigGenerator, "_validate_toml", staticmethod(calls.append))
+    monkeypatch.setattr(ConfigGenerator, "_toml_cache_version", -1)
+
+    monkeypatch.setattr(sys, "argv", ["xsp-generate-config"])
+    generate_config.main()
+    assert len(calls) == 1
+
+    monkeypatch.setattr(sys, "argv", ["xsp-generate-config", "--no-validate"])
+    generate_config.main()
+    assert len(calls) == 1
+    assert "[vast]" in capsys.readouterr().out
+
+
+def test_generate_config_cli_output_independent_of_validation(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that --no-validate prints byte-identical output to the default path."""
+    import sys
+
+    pytest.importorskip("httpx")
+    from xsp.cli import generate_config
+
+    monkeypatch.setattr(sys, "argv", ["xsp-generate-config"])
+    generate_config.main()
+    validated = capsys.readouterr().out
+
+    monkeypatch.setattr(sys, "argv", ["xsp-generate-config", "--no-validate"])
+    generate_config.main()
+    streamed = capsys.readouterr().out
+
+    assert streamed == validated
@@ -1,11 +1,31 @@
 """Tests for configurable decorator."""
 
+from collections.abc import Iterator
+
 import pytest
 
+import xsp.core.configurable as configurable_module
 from xsp.core.config_generator import ConfigGenerator
 from xsp.core.configurable import configurable, get_configurable_registry
 
 
+@pytest.fixture(autouse=True)
+def isolated_registry() -> Iterator[None]:
+    """Restore the global registry and its indexes after each test."""
+    registry = dict(configurable_module._CONFIGURABLE_REGISTRY)
+    by_namespace = dict(configurable_module._BY_NAMESPACE)
+    sorted_namespaces = list(configurable_module._SORTED_NAMESPACES)
+    yield
+    # Restored in place: get_configurable_registry() is a view of this dict
+    configurable_module._CONFIGURABLE_REGISTRY.clear()
+    configurable_module._CONFIGURABLE_REGISTRY.update(registry)
+    configurable_module._BY_NAMESPACE.clear()
+    configurable_module._BY_NAMESPACE.update(by_namespace)
+    configurable_module._SORTED_NAMESPACES[:] = sorted_namespaces
+    # Invalidate caches keyed on the registry version
+    configurable_module._REGISTRY_VERSION += 1
+
+
 def test_configurable_decorator() -> None:
     """Test @configurable decorator registration."""
 
@@ -159,3 +179,502 @@ def test_config_generator_none_default() -> None:
 
     toml = ConfigGenerator.generate_toml()
     assert 'optional_param = ""' in toml
+
+
+def test_value_to_toml_scalar_dispatch() -> None:
+    """Test that scalar defaults are formatted by exact type."""
+    from enum import Enum
+
+    from xsp.core.configurable import _value_to_toml
+
+    class Mode(Enum):
+        FAST = "fast"
+
+    assert _value_to_toml(True) == "true"
+    assert _value_to_toml(False) == "false"
+    assert _value_to_toml(1) == "1"
+    assert _value_to_toml(2.5) == "2.5"
+    assert _value_to_toml(None) == '""'
+    assert _value_to_toml(Mode.FAST) == '"fast"'
+    assert _value_to_toml([1, "a", True]) == '[1, "a", true]'
+    assert _value_to_toml((1.5,)) == "[1.5]"
+    assert _value_to_toml({"k": [Mode.FAST]}) == '{k = ["fast"]}'
+    assert _value_to_toml('a"b\\c\n\x00') == '"a\\"b\\\\c\\n\\u0000"'
+
+
+def test_value_to_toml_fallback_is_escaped() -> None:
+    """Test that unknown types are written as escaped TOML strings."""
+    import tomllib
+
+    from xsp.core.configurable import _value_to_toml
+
+    class Quoted:
+        def __str__(self) -> str:
+            return 'say "hi" \\ bye'
+
+    rendered = _value_to_toml(Quoted())
+
+    assert tomllib.loads(f"v = {rendered}")["v"] == 'say "hi" \\ bye'
+
+
+def test_generate_toml_template_sections() -> None:
+    """Test that the template emits one newline-separated section per namespace."""
+    from xsp.core.configurable import generate_toml_template
+
+    @configurable(namespace="template_test", description="Template test")
+    class TemplateClass:
+        def __init__(self, *, retries: int = 3, enabled: bool = True) -> None:
+            pass
+
+    template = generate_toml_template()
+
+    assert "# Template test\n[template_test]\nenabled = true\nretries = 3\n" in template
+
+
+def test_write_toml_template_matches_generate() -> None:
+    """Test that streaming the template matches the string variant."""
+    import io
+
+    from xsp.core.configurable import generate_toml_template, write_toml_template
+
+    buf = io.StringIO()
+    write_toml_template(buf)
+
+    assert buf.getvalue() == generate_toml_template()
+
+
+def test_generate_toml_template_cached_until_registration() -> None:
+    """Test that the template string is reused until a class registers."""
+    from xsp.core.configurable import generate_toml_template
+
+    first = generate_toml_template()
+    assert generate_toml_template() is first
+
+    @configurable(namespace="template_cache_test")
+    class Late:
+        def __init__(self, *, n: int = 5) -> None:
+            pass
+
+    assert "[template_cache_test]" in generate_toml_template()
+
+
+def test_generate_toml_template_overrides() -> None:
+    """Test that overrides replace only the named values."""
+    from xsp.core.configurable import generate_toml_template
+
+    @configurable(namespace="override_test")
+    class Overridden:
+        def __init__(self, *, host: str = "localhost", port: int = 80) -> None:
+            pass
+
+    template = generate_toml_template({"override_test.port": 8080})
+
+    assert '[override_test]\nhost = "localhost"\nport = 8080\n' in template
+    assert "port = 80\n" in generate_toml_template()
+    with pytest.raises(KeyError, match="override_test.missing"):
+        generate_toml_template({"override_test.missing": 1})
+
+
+def test_format_type_strips_typing_prefix() -> None:
+    """Test that generic annotations keep their arguments without typing. noise."""
+    # typing aliases on purpose: their str() carries the "typing." prefix
+    from typing import Any, Dict, List, Optional  # noqa: UP035
+
+    from xsp.core.configurable import _format_type
+
+    assert _format_type(int) == "int"
+    assert _format_type(list[str]) == "list[str]"
+    hint = Optional[List[Dict[str, Any]]]  # noqa: UP006, UP007
+    assert _format_type(hint) == "Optional[List[Dict[str, Any]]]"
+
+
+def test_generate_toml_to_stream_matches_string() -> None:
+    """Test that streaming the template writes the same text generate_toml returns."""
+    import io
+
+    @configurable(namespace="stream_test")
+    class StreamClass:
+        def __init__(self, *, size: int = 8) -> None:
+            pass
+
+    buf = io.StringIO()
+    ConfigGenerator.generate_toml_to(buf)
+
+    assert buf.getvalue() == ConfigGenerator.generate_toml()
+    assert "size = 8" in buf.getvalue()
+
+
+def test_config_generator_comment_defaults() -> None:
+    """Test that include_defaults=False comments out every assignment."""
+    import tomllib
+
+    @configurable(namespace="placeholder_test")
+    class PlaceholderClass:
+        def __init__(self, *, limit: int = 10) -> None:
+            pass
+
+    toml = ConfigGenerator.generate_toml(include_defaults=False)
+
+    assert "# limit = 10\n" in toml
+    assert "placeholder_test" in tomllib.loads(toml)
+    assert tomllib.loads(toml)["placeholder_test"] == {}
+
+
+def test_config_generator_dict() -> None:
+    """Test that generate_dict mirrors the parsed TOML without rendering it."""
+    from enum import Enum
+
+    class Level(Enum):
+        HIGH = "high"
+
+    @configurable(namespace="dict_test")
+    class DictClass:
+        def __init__(
+            self, *, level: Level = Level.HIGH, label: str | None = None, count: int = 2
+        ) -> None:
+            pass
+
+    data = ConfigGenerator.generate_dict()
+
+    assert data["dict_test"] == {"level": "high", "label": "", "count": 2}
+
+
+def test_config_generator_dict_matches_parsed_toml() -> None:
+    """Test that generate_dict converts defaults the way the TOML writer does."""
+    import tomllib
+
+    @configurable(namespace="dict_round_trip")
+    class RoundTripClass:
+        def __init__(
+            self,
+            *,
+            xs: tuple[int, ...] = (1, 2),
+            o: object = object,
+            nested: dict[int, tuple[int, None]] = {1: (2, None)},
+        ) -> None:
+            pass
+
+    data = ConfigGenerator.generate_dict()
+
+    assert data["dict_round_trip"] == {
+        "xs": [1, 2],
+        "o": "<class 'object'>",
+        "nested": {"1": [2, ""]},
+    }
+    assert data == tomllib.loads(ConfigGenerator.generate_toml())
+
+
+def test_group_by_namespace_uses_given_registry() -> None:
+    """Test that namespace grouping iterates the mapping it is passed."""
+    from xsp.core.configurable import snapshot_registry
+
+    @configurable(namespace="group_snapshot_b")
+    class SnapshotB:
+        def __init__(self, *, b: int = 2) -> None:
+            pass
+
+    @configurable(namespace="group_snapshot_a")
+    class SnapshotA:
+        def __init__(self, *, a: int = 1) -> None:
+            pass
+
+    snapshot = snapshot_registry()
+    subset = {ns: snapshot[ns] for ns in ("group_snapshot_b", "group_snapshot_a")}
+
+    grouped = ConfigGenerator._group_by_namespace(subset)
+
+    assert list(grouped) == ["group_snapshot_a", "group_snapshot_b"]
+    assert [m.cls for m in grouped["group_snapshot_a"]] == [SnapshotA]
+    assert list(ConfigGenerator._group_by_namespace(snapshot)) == sorted(snapshot)
+
+
+def test_extract_parameters_cached_per_class() -> None:
+    """Test that re-decorating a class reuses the extracted parameters."""
+    from xsp.core.configurable import _extract_parameters
+
+    class Reused:
+        def __init__(self, *, depth: int = 4) -> None:
+            pass
+
+    first = configurable(namespace="reuse_a")(Reused)
+    second = configurable(namespace="reuse_b")(Reused)
+
+    assert first is second
+    registry = get_configurable_registry()
+    assert registry["reuse_a"].parameters is registry["reuse_b"].parameters
+    assert _extract_parameters(Reused) is registry["reuse_a"].parameters
+
+
+def test_parameter_descriptions_from_init_docstring() -> None:
+    """Test that Args: entries become parameter descriptions."""
+
+    @configurable(namespace="args_doc_test")
+    class ArgsDocClass:
+        def __init__(self, *, timeout: float = 30.0, retries: int = 3) -> None:
+            """
+            Initialize class.
+
+            Args:
+                timeout: Request timeout in seconds
+                retries (int): Retry attempts
+                    before giving up
+
+            Raises:
+                ValueError: Never
+            """
+
+    params = get_configurable_registry()["args_doc_test"].parameters
+
+    assert params["timeout"].description == "Request timeout in seconds"
+    assert params["retries"].description == "Retry attempts before giving up"
+    assert "ValueError" not in params
+
+
+def test_metadata_dataclasses_are_frozen() -> None:
+    """Test that metadata objects reject mutation."""
+    import dataclasses
+
+    @configurable(namespace="slots_test")
+    class SlotsClass:
+        def __init__(self, *, size: int = 1) -> None:
+            pass
+
+    metadata = get_configurable_registry()["slots_test"]
+    param = metadata.parameters["size"]
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        param.default = 2  # type: ignore[misc]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        metadata.namespace = "other"  # type: ignore[misc]
+
+
+def test_generate_toml_cached_until_registration() -> None:
+    """Test that generate_toml reuses its output until the registry changes."""
+
+    @configurable(namespace="memo_a")
+    class MemoA:
+        def __init__(self, *, value: int = 1) -> None:
+            pass
+
+    first = ConfigGenerator.generate_toml()
+    assert ConfigGenerator.generate_toml() is first
+
+    @configurable(namespace="memo_b")
+    class MemoB:
+        def __init__(self, *, value: int = 2) -> None:
+            pass
+
+    refreshed = ConfigGenerator.generate_toml()
+    assert refreshed is not first
+    assert "[memo_b]" in refreshed
+
+
+def test_registry_view_is_read_only() -> None:
+    """Test that the registry accessor returns a live, read-only view."""
+    from xsp.core.configurable import snapshot_registry
+
+    registry = get_configurable_registry()
+    snapshot = snapshot_registry()
+
+    @configurable(namespace="view_test")
+    class ViewClass:
+        def __init__(self, *, flag: bool = False) -> None:
+            pass
+
+    assert "view_test" in registry
+    assert "view_test" not in snapshot
+    with pytest.raises(TypeError):
+        registry["view_test"] = registry["view_test"]  # type: ignore[index]
+
+
+def test_get_configurable_by_namespace() -> None:
+    """Test namespace lookups list every class registered under it."""
+    from xsp.core.configurable import get_configurable_by_namespace
+
+    @configurable(namespace="index_test")
+    class First:
+        def __init__(self, *, a: int = 1) -> None:
+            pass
+
+    @configurable(namespace="index_test")
+    class Second:
+        def __init__(self, *, b: int = 2) -> None:
+            pass
+
+    configurable(namespace="index_test")(First)
+
+    found = get_configurable_by_namespace("index_test")
+
+    assert [m.cls for m in found] == [Second, First]
+    assert get_configurable_by_namespace("missing_namespace") == ()
+
+
+def test_get_configurable_by_namespace_replaces_rerun_definitions() -> None:
+    """Test that re-running one class definition keeps a single index entry."""
+    import warnings
+
+    from xsp.core.configurable import get_configurable_by_namespace
+
+    def make() -> type:
+        @configurable(namespace="rerun_index_test")
+        class Rebuilt:
+            def __init__(self, *, n: int = 1) -> None:
+                pass
+
+        return Rebuilt
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        classes = [make() for _ in range(3)]
+
+    assert [m.cls for m in get_configurable_by_namespace("rerun_index_test")] == [classes[-1]]
+
+
+def test_positional_only_init_has_no_parameters() -> None:
+    """Test that an __init__ without keyword-only params yields no parameters."""
+
+    @configurable(namespace="positional_test")
+    class PositionalClass:
+        def __init__(self, host: str = "localhost", port: int = 80) -> None:
+            pass
+
+    assert get_configurable_registry()["positional_test"].parameters == {}
+
+
+def test_class_without_init_has_no_parameters() -> None:
+    """Test that a class inheriting object.__init__ registers with no parameters."""
+
+    @configurable(namespace="no_init_test")
+    class NoInit:
+        pass
+
+    metadata = get_configurable_registry()["no_init_test"]
+    assert metadata.parameters == {}
+    assert NoInit.__configurable_metadata__ is metadata  # type: ignore[attr-defined]
+
+
+def test_namespace_and_parameter_names_are_interned() -> None:
+    """Test that namespace and parameter names are interned at decoration."""
+    import sys
+
+    @configurable(namespace="".join(["intern", "_test"]))
+    class Interned:
+        def __init__(self, *, pool_size: int = 4) -> None:
+            pass
+
+    metadata = Interned.__configurable_metadata__  # type: ignore[attr-defined]
+    assert metadata.namespace is sys.intern("intern_test")
+    (name,) = metadata.parameters
+    assert name is sys.intern("pool_size")
+    assert metadata.parameters[name].name is name
+
+
+def test_enum_defaults_are_unwrapped_once() -> None:
+    """Test enum defaults, including members inside containers, render by value."""
+    import enum
+
+    class Mode(enum.Enum):
+        FAST = "fast"
+        SAFE = "safe"
+
+    @configurable(namespace="enum_literal_test")
+    class EnumClass:
+        def __init__(self, *, mode: Mode = Mode.FAST, fallbacks: tuple = (Mode.SAFE,)) -> None:
+            pass
+
+    params = get_configurable_registry()["enum_literal_test"].parameters
+    assert params["mode"].toml_default == "fast"
+    assert params["mode"].toml_value == '"fast"'
+    assert params["fallbacks"].toml_value == '["safe"]'
+
+
+def test_sorted_parameters_precomputed() -> None:
+    """Test that parameters are sorted by name once on the metadata."""
+
+    @configurable(namespace="sorted_params_test")
+    class Unordered:
+        def __init__(self, *, zeta: int = 1, alpha: int = 2) -> None:
+            pass
+
+    metadata = get_configurable_registry()["sorted_params_test"]
+    assert list(metadata.parameters) == ["zeta", "alpha"]
+    assert [name for name, _ in metadata.sorted_parameters] == ["alpha", "zeta"]
+
+
+def test_bind_merges_overrides_onto_defaults() -> None:
+    """Test that bind() builds constructor kwargs without inspect."""
+
+    @configurable(namespace="bind_test")
+    class Bound:
+        def __init__(self, *, host: str = "localhost", port: int = 80) -> None:
+            self.host = host
+            self.port = port
+
+    metadata = get_configurable_registry()["bind_test"]
+
+    assert metadata.bind() == {"host": "localhost", "port": 80}
+    assert Bound(**metadata.bind(port=8080)).port == 8080
+    with pytest.raises(TypeError, match="missing"):
+        metadata.bind(missing=1)
+
+
+def test_bind_builds_vast_upstream_kwargs() -> None:
+    """Test the documented bind() example against the registered VastUpstream."""
+    from xsp.protocols.vast.upstream import VastUpstream
+    from xsp.transports.memory import MemoryTransport
+
+    metadata = get_configurable_registry()["vast"]
+    upstream = VastUpstream(
+        MemoryTransport(b"<VAST/>"),
+        endpoint="https://ads.example.com/vast",
+        **metadata.bind(validate_xml=True),
+    )
+
+    assert upstream.validate_xml is True
+    with pytest.raises(TypeError, match="timeout"):
+        metadata.bind(timeout=5.0)
+
+
+def test_redecorating_same_class_warns() -> None:
+    """Test that running @configurable again for one class definition warns."""
+
+    def make() -> type:
+        @configurable(namespace="redecorate_test")
+        class Rebuilt:
+            def __init__(self, *, n: int = 1) -> None:
+                pass
+
+        return Rebuilt
+
+    make()
+    with pytest.warns(RuntimeWarning, match="decorate classes once"):
+        make()
+
+
+def test_toml_output_quotes_keys_and_comments_every_line() -> None:
+    """Test that odd keys are quoted and multi-line descriptions stay comments."""
+    import tomllib
+
+    from xsp.core.configurable import ParameterInfo, generate_toml_template
+
+    @configurable(namespace="my app", description="Line one\nLine two")
+    class SpacedNamespace:
+        def __init__(
+            self, *, headers: dict[str, str] = {"User Agent": "x"}, quoted: str = 'say "hi"'
+        ) -> None:
+            pass
+
+    info = ParameterInfo("p", "str", "v", description="First\nSecond")
+    assert info.comment == "# First\n# Second\n# Type: str\n"
+
+    for text in (
+        ConfigGenerator.generate_toml(),
+        ConfigGenerator.generate_toml(include_defaults=False),
+        generate_toml_template(),
+    ):
+        tomllib.loads(text)
+
+    assert '["my app"]' in generate_toml_template()
+    parsed = tomllib.loads(ConfigGenerator.generate_toml())
+    assert parsed["my app"]["headers"] == {"User Agent": "x"}
+    assert parsed["my app"]["quoted"] == 'say "hi"'
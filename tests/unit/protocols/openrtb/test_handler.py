@@ -7,6 +7,7 @@ References:
     - OpenRTB 2.6 Specification: https://www.iab.com/wp-content/uploads/2016/03/OpenRTB-API-Specification-Version-2-6-FINAL.pdf
 """
 
+import uuid
 from unittest.mock import AsyncMock
 
 import pytest
@@ -158,6 +159,11 @@ async def test_build_bid_request_minimal(
     assert "id" in imp
     assert imp["tagid"] == "test-slot-123"
 
+    # Request and impression IDs are distinct random UUID4s
+    assert uuid.UUID(bid_request["id"]).version == 4
+    assert uuid.UUID(imp["id"]).version == 4
+    assert imp["id"] != bid_request["id"]
+
     # Verify user
     assert "user" in bid_request
     assert bid_request["user"]["id"] == "user-456"
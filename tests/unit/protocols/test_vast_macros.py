@@ -1,7 +1,7 @@
 """Tests for VAST macro substitution."""
 
 
-from xsp.protocols.vast.macros import MacroSubstitutor
+from xsp.protocols.vast.macros import MacroSubstitutor, _encode_value
 
 
 def test_macro_substitutor_timestamp() -> None:
@@ -47,3 +47,41 @@ def test_macro_substitutor_custom() -> None:
     result = sub.substitute(url)
     assert "[CUSTOM]" not in result
     assert "c=custom_value" in result
+
+
+def test_macro_substitutor_without_placeholders() -> None:
+    """Test that URLs without macros are returned untouched."""
+    calls: list[str] = []
+    sub = MacroSubstitutor()
+    sub.register("CUSTOM", lambda: calls.append("custom") or "x")
+
+    url = "https://tracking.example.com/imp?c=1"
+    assert sub.substitute(url, {"contentplayhead": "00:00:10"}) is url
+    assert calls == []
+
+
+def test_macro_substitutor_encodes_non_numeric_provider_values() -> None:
+    """Test that numeric values pass through and others are percent-encoded."""
+    sub = MacroSubstitutor()
+    sub.register("CUSTOM", lambda: "a b")
+
+    result = sub.substitute("https://t.example.com/imp?ts=[TIMESTAMP]&c=[CUSTOM]")
+    ts = result.split("ts=")[1].split("&")[0]
+    assert ts.isdigit() and len(ts) >= 13
+    assert result.endswith("c=a%20b")
+
+
+def test_macro_substitutor_reuses_encoded_context_values() -> None:
+    """Test that repeated context values are encoded once but cachebusting stays fresh."""
+    sub = MacroSubstitutor()
+    url = "https://t.example.com/imp?u=[USER_ID]&cb=[CACHEBUSTING]"
+    context = {"user_id": "user 42/xyz"}
+
+    first = sub.substitute(url, context)
+    hits = _encode_value.cache_info().hits
+    second = sub.substitute(url, context)
+
+    assert _encode_value.cache_info().hits == hits + 1
+    assert "u=user%2042%2Fxyz" in first and "u=user%2042%2Fxyz" in second
+    cachebusters = {sub.substitute(url, context).rsplit("cb=", 1)[1] for _ in range(20)}
+    assert len(cachebusters) > 1
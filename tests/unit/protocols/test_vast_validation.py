@@ -2,7 +2,11 @@
 
 import pytest
 
-from xsp.protocols.vast.validation import VastValidationError, validate_vast_xml
+from xsp.protocols.vast.validation import (
+    VastValidationError,
+    validate_vast_xml,
+    validate_vast_xml_or_none,
+)
 
 
 def test_validate_vast_xml_valid() -> None:
@@ -36,3 +40,23 @@ def test_validate_vast_xml_malformed() -> None:
 
     with pytest.raises(VastValidationError, match="Invalid XML"):
         validate_vast_xml(xml)
+
+
+@pytest.mark.parametrize(
+    "xml",
+    [
+        '<VAST version="4.2"><Ad>',
+        '<Invalid version="4.2"></Invalid>',
+        "<VAST></VAST>",
+    ],
+)
+def test_validate_vast_xml_or_none_invalid(xml: str) -> None:
+    """Test that the non-raising variant returns None for invalid XML."""
+    assert validate_vast_xml_or_none(xml) is None
+
+
+def test_validate_vast_xml_or_none_matches_validate() -> None:
+    """Test that the non-raising variant returns the same structure."""
+    xml = '<VAST version="4.2"><Ad id="123"></Ad></VAST>'
+
+    assert validate_vast_xml_or_none(xml) == validate_vast_xml(xml)
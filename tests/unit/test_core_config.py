@@ -1,9 +1,18 @@
+import threading
+import time
 from pathlib import Path
+from typing import Any
 
 import pytest
 from pydantic import ValidationError
 
-from xsp.core.config import XspSettings
+from xsp.core import config
+from xsp.core.config import (
+    XspSettings,
+    get_settings,
+    set_settings,
+    set_settings_overrides,
+)
 
 
 @pytest.mark.parametrize(
@@ -232,3 +241,113 @@ def test_xsp_settings_case_insensitive(monkeypatch: pytest.MonkeyPatch) -> None:
     assert settings.env == "staging"
     assert settings.debug is True
     assert settings.vast_timeout == 45.0
+
+
+def test_get_settings_concurrent_first_access(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Concurrent first calls to get_settings() build a single instance."""
+
+    built: list[XspSettings] = []
+
+    def counting_load() -> XspSettings:
+        instance = XspSettings()
+        built.append(instance)
+        return instance
+
+    monkeypatch.setattr(config, "_load_settings", counting_load)
+    set_settings(None)
+    barrier = threading.Barrier(8)
+    results: list[XspSettings] = []
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(get_settings())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        set_settings(None)
+
+    assert len(built) == 1
+    assert all(r is built[0] for r in results)
+
+
+def test_set_settings_overrides_copies_current(monkeypatch: pytest.MonkeyPatch) -> None:
+    """set_settings_overrides() swaps in an updated copy of the global settings."""
+
+    monkeypatch.delenv("XSP_VAST_TIMEOUT", raising=False)
+    base = XspSettings()
+    set_settings(base)
+    try:
+        updated = set_settings_overrides(vast_timeout=5.0, debug=True)
+
+        assert get_settings() is updated
+        assert updated.vast_timeout == 5.0
+        assert updated.debug is True
+        assert updated.vast_endpoint == base.vast_endpoint
+        assert base.vast_timeout == 30.0
+    finally:
+        set_settings(None)
+
+
+def test_set_settings_overrides_concurrent_calls_compose(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Concurrent set_settings_overrides() calls each build on the other's result."""
+
+    original_copy = XspSettings.model_copy
+
+    def slow_copy(self: XspSettings, **kwargs: Any) -> XspSettings:
+        # Widen the read-copy-store window so an unlocked read would race
+        time.sleep(0.01)
+        return original_copy(self, **kwargs)
+
+    monkeypatch.setattr(XspSettings, "model_copy", slow_copy)
+    set_settings(XspSettings())
+    barrier = threading.Barrier(2)
+
+    def worker(**overrides: Any) -> None:
+        barrier.wait()
+        set_settings_overrides(**overrides)
+
+    threads = [
+        threading.Thread(target=worker, kwargs={"vast_timeout": 5.0}),
+        threading.Thread(target=worker, kwargs={"openrtb_timeout": 7.0}),
+    ]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        settings = get_settings()
+        assert settings.vast_timeout == 5.0
+        assert settings.openrtb_timeout == 7.0
+    finally:
+        set_settings(None)
+
+
+def test_get_settings_reads_env_file_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """get_settings() parses .env once; environment variables still win."""
+
+    (tmp_path / ".env").write_text("XSP_VAST_TIMEOUT=12.5\nXSP_DEBUG=true\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("XSP_VAST_TIMEOUT", raising=False)
+    monkeypatch.setenv("XSP_DEBUG", "false")
+    monkeypatch.setattr(config, "_dotenv_cache", None)
+    set_settings(None)
+    try:
+        first = get_settings()
+        assert first.vast_timeout == 12.5
+        assert first.debug is False
+
+        (tmp_path / ".env").write_text("XSP_VAST_TIMEOUT=99.0\n")
+        set_settings(None)
+        assert get_settings().vast_timeout == 12.5
+    finally:
+        set_settings(None)
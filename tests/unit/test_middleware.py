@@ -122,3 +122,52 @@ async def test_middleware_can_modify_kwargs():
         "override": "middleware",
     }
     assert upstream.received_kwargs == result
+
+
+@pytest.mark.asyncio
+async def test_frequency_cap_remembers_exceeded_keys():
+    """Over-cap keys are rejected locally without another store read."""
+    from xsp.core.exceptions import FrequencyCapExceeded
+    from xsp.middleware.frequency import (
+        FrequencyCap,
+        FrequencyCappingMiddleware,
+        InMemoryFrequencyStore,
+    )
+
+    class CountingStore(InMemoryFrequencyStore):
+        def __init__(self) -> None:
+            super().__init__()
+            self.reads = 0
+
+        async def get_count(self, key: str) -> int:
+            self.reads += 1
+            return await super().get_count(key)
+
+    async def handler(**kwargs):
+        return "ok"
+
+    store = CountingStore()
+    middleware = FrequencyCappingMiddleware(
+        FrequencyCap(max_impressions=1, time_window_seconds=60),
+        store,
+        exceeded_cache_ttl=1.0,
+    )
+
+    assert await middleware(None, handler, user_id="u1") == "ok"
+    with pytest.raises(FrequencyCapExceeded, match="1/1"):
+        await middleware(None, handler, user_id="u1")
+    for _ in range(2):
+        with pytest.raises(FrequencyCapExceeded, match="recently found at or over 1 "):
+            await middleware(None, handler, user_id="u1")
+
+    # One read for the allowed request, one that found the cap exceeded
+    assert store.reads == 2
+
+    # Off by default: every request reads the store
+    uncached = FrequencyCappingMiddleware(
+        FrequencyCap(max_impressions=1, time_window_seconds=60), store
+    )
+    for _ in range(2):
+        with pytest.raises(FrequencyCapExceeded, match="1/1"):
+            await uncached(None, handler, user_id="u1")
+    assert store.reads == 4
@@ -0,0 +1,40 @@
+"""Tests that per-request value types carry no instance __dict__."""
+
+from collections.abc import Callable
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from xsp.core.config import UpstreamConfig
+from xsp.core.configurable import ConfigMetadata, ParameterInfo
+from xsp.core.session import SessionContext
+from xsp.middleware.budget import Budget
+from xsp.middleware.frequency import FrequencyCap
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        lambda: SessionContext(
+            request_id="req-001", user_id=None, ip_address=None, timestamp=datetime.now()
+        ),
+        lambda: FrequencyCap(max_impressions=3, time_window_seconds=3600),
+        lambda: Budget(total_budget=Decimal("10.00"), spent=Decimal("0"), currency="USD"),
+        lambda: UpstreamConfig(endpoint="https://example.com"),
+        lambda: ParameterInfo("size", "int", 1),
+        lambda: ConfigMetadata(cls=object, namespace="slots_test", description=None),
+    ],
+    ids=[
+        "SessionContext",
+        "FrequencyCap",
+        "Budget",
+        "UpstreamConfig",
+        "ParameterInfo",
+        "ConfigMetadata",
+    ],
+)
+def test_instances_have_no_dict(factory: Callable[[], Any]) -> None:
+    """Slotted types allocate no per-instance __dict__."""
+    assert not hasattr(factory(), "__dict__")
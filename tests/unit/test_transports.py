@@ -44,3 +44,62 @@ async def test_file_transport_nonexistent_file():
 
     with pytest.raises(FileNotFoundError):
         await transport.request(endpoint="/nonexistent/file.txt")
+
+
+@pytest.mark.parametrize("error_cls", ["TransportError", "VastHttpError", "OpenRTBHttpError"])
+def test_status_code_errors_use_slots(error_cls):
+    """status_code lives in a slot, so raising doesn't allocate a __dict__."""
+    from xsp.core import exceptions
+
+    cls = getattr(exceptions, error_cls)
+    error = cls("upstream failed", status_code=502)
+
+    assert error.status_code == 502
+    assert not vars(error)
+
+
+@pytest.mark.parametrize(
+    "error_cls",
+    ["TransportError", "TransportTimeoutError", "VastHttpError", "OpenRTBHttpError"],
+)
+def test_status_code_errors_survive_copy_and_pickle(error_cls):
+    """The slotted status_code and any notes are kept by copy and pickle."""
+    import copy
+    import pickle
+
+    from xsp.core import exceptions
+
+    error = getattr(exceptions, error_cls)("upstream failed", status_code=502)
+    error.add_note("while fetching")
+
+    for clone in (copy.copy(error), pickle.loads(pickle.dumps(error))):
+        assert type(clone) is type(error)
+        assert clone.args == ("upstream failed",)
+        assert clone.status_code == 502
+        assert clone.__notes__ == ["while fetching"]
+
+
+def test_transport_error_subclasses_default_status_code():
+    """Transport subclasses inherit the slotted status_code default."""
+    from xsp.core.exceptions import TransportConnectionError, TransportTimeoutError
+
+    assert TransportTimeoutError("slow").status_code is None
+    assert TransportConnectionError("refused").status_code is None
+
+
+def test_status_code_errors_support_match():
+    """HTTP errors expose status_code positionally to match/case."""
+    from xsp.core.exceptions import VastHttpError
+
+    def classify(error: Exception) -> str:
+        match error:
+            case VastHttpError(404):
+                return "not found"
+            case VastHttpError(status) if 500 <= status < 600:
+                return "server"
+            case _:
+                return "other"
+
+    assert classify(VastHttpError("missing", 404)) == "not found"
+    assert classify(VastHttpError("unavailable", 503)) == "server"
+    assert classify(VastHttpError("teapot", 418)) == "other"
@@ -87,3 +87,39 @@ async def test_upstream_with_default_headers():
 
     result = await upstream.request()
     assert result == "test"
+
+
+def test_upstream_timeout_alias():
+    """UpstreamTimeout remains the same class as UpstreamTimeoutError."""
+    from xsp import UpstreamTimeout, UpstreamTimeoutError
+
+    assert UpstreamTimeout is UpstreamTimeoutError
+    with pytest.raises(UpstreamTimeout):
+        raise UpstreamTimeoutError("slow")
+
+
+@pytest.mark.asyncio
+async def test_request_merges_without_touching_defaults():
+    """Per-call params/headers merge over defaults without mutating them."""
+    seen: list[dict[str, str]] = []
+
+    class RecordingTransport(MemoryTransport):
+        async def request(self, endpoint, payload=None, metadata=None, timeout=None):
+            seen.append(metadata)
+            return await super().request(endpoint, payload, metadata, timeout)
+
+    upstream = BaseUpstream(
+        transport=RecordingTransport(b"ok"),
+        decoder=lambda b: b.decode("utf-8"),
+        default_params={"a": "1"},
+        default_headers={"X-Default": "d"},
+    )
+
+    await upstream.request()
+    await upstream.request(params={"b": "2"}, headers={"X-Call": "c"})
+
+    assert seen[0] == {"X-Default": "d", "_params": '{"a": "1"}'}
+    assert seen[1]["X-Call"] == "c"
+    assert seen[1]["_params"] == '{"a": "1", "b": "2"}'
+    assert upstream.default_params == {"a": "1"}
+    assert upstream.default_headers == {"X-Default": "d"}